@@ -1,85 +1,233 @@
 import PyInstaller.__main__
+import hashlib
 import os
 import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 os.environ["PYTHONOPTIMIZE"] = "2"
 
-# Run PyInstaller to create a single executable
-PyInstaller.__main__.run(
-    [
-        "--noconfirm",
-        "--clean",
-        "-F",
-        # "--windowed",
-        "--exclude-module=torch",
-        "--exclude-module=tensorflow",
-        "--exclude-module=faster_whisper",
-        # "--exclude-module=transformers.trainer",  # Exclude training utilities
-        "--exclude-module=numpy",
-        "--exclude-module=scipy",
-        "--exclude-module=opencv_python",
-        "--exclude-module=opencv_python_headless",
-        # transformers exclusions
-        "--exclude-module=transformers.pipelines",
-        "--exclude-module=transformers.generation",
-        "--exclude-module=transformers.optimization",
-        "--exclude-module=transformers.models",  # Exclude unused models
-        "--exclude-module=transformers.trainer",
-        "--exclude-module=transformers.trainer_utils",
-        "--exclude-module=transformers.trainer_callback",
-        "--exclude-module=transformers.benchmark",
-        "--exclude-module=transformers.commands",
-        "--exclude-module=transformers.convert_graph_to_onnx",
-        "--exclude-module=transformers.integrations",
-        "--exclude-module=transformers.tokenization_bert",
-        "--exclude-module=transformers.tokenization_gpt2",
-        "--exclude-module=transformers.tokenization_t5",
-        # New transformers exclusions
-        "--exclude-module=transformers.tokenization_albert",
-        "--exclude-module=transformers.tokenization_bart",
-        "--exclude-module=transformers.tokenization_distilbert",
-        "--exclude-module=transformers.tokenization_electra",
-        "--exclude-module=transformers.tokenization_roberta",
-        "--exclude-module=transformers.tokenization_xlnet",
-        "--exclude-module=transformers.tokenization_t5_fast",
-        "--exclude-module=transformers.feature_extraction_utils",
-        "--exclude-module=transformers.image_processing_utils",
-        "--exclude-module=transformers.audio_utils",
-        "--exclude-module=transformers.data",
-        "--exclude-module=transformers.data.datasets",
-        "--exclude-module=transformers.data.metrics",
-        "--exclude-module=transformers.data.processors",
-        "--exclude-module=transformers.testing_utils",
-        "--exclude-module=transformers.debug_utils",
-        "--exclude-module=transformers.modeling_tf_utils",
-        "--exclude-module=transformers.modeling_flax_utils",
-        "--exclude-module=transformers.onnx",
-        "--exclude-module=transformers.sagemaker",
-        "--exclude-module=transformers.tools",
-        "--exclude-module=transformers.utils.hub",
-        "main.py",
-    ]
+BUILD_HASH_FILE = "dist/.build_hash"
+BUILT_EXECUTABLE = os.path.join(
+    "dist", "main", "main.exe" if os.name == "nt" else "main"
 )
+# Hashed by content: a package upgrade changes no .py file under the root
+FINGERPRINT_FILES = ("requirements.txt",)
+# Folders that hold no application sources (models are copied separately)
+SKIP_DIRS = {
+    ".git",
+    "__pycache__",
+    "build",
+    "dist",
+    "logs",
+    "machine_models",
+    "venv",
+    ".venv",
+}
 
+# PyInstaller keeps its analysis cache in build/ between runs
+PYINSTALLER_ARGS = [
+    "--noconfirm",
+    # Onedir: the app starts from dist/main without unpacking itself to a temp
+    # folder on every launch, next to the models and assets copied below
+    "-D",
+    # "--windowed",
+    "--exclude-module=torch",
+    "--exclude-module=tensorflow",
+    "--exclude-module=faster_whisper",
+    # "--exclude-module=transformers.trainer",  # Exclude training utilities
+    "--exclude-module=numpy",
+    "--exclude-module=scipy",
+    "--exclude-module=opencv_python",
+    "--exclude-module=opencv_python_headless",
+    # transformers exclusions
+    "--exclude-module=transformers.pipelines",
+    "--exclude-module=transformers.generation",
+    "--exclude-module=transformers.optimization",
+    "--exclude-module=transformers.models",  # Exclude unused models
+    "--exclude-module=transformers.trainer",
+    "--exclude-module=transformers.trainer_utils",
+    "--exclude-module=transformers.trainer_callback",
+    "--exclude-module=transformers.benchmark",
+    "--exclude-module=transformers.commands",
+    "--exclude-module=transformers.convert_graph_to_onnx",
+    "--exclude-module=transformers.integrations",
+    "--exclude-module=transformers.tokenization_bert",
+    "--exclude-module=transformers.tokenization_gpt2",
+    "--exclude-module=transformers.tokenization_t5",
+    # New transformers exclusions
+    "--exclude-module=transformers.tokenization_albert",
+    "--exclude-module=transformers.tokenization_bart",
+    "--exclude-module=transformers.tokenization_distilbert",
+    "--exclude-module=transformers.tokenization_electra",
+    "--exclude-module=transformers.tokenization_roberta",
+    "--exclude-module=transformers.tokenization_xlnet",
+    "--exclude-module=transformers.tokenization_t5_fast",
+    "--exclude-module=transformers.feature_extraction_utils",
+    "--exclude-module=transformers.image_processing_utils",
+    "--exclude-module=transformers.audio_utils",
+    "--exclude-module=transformers.data",
+    "--exclude-module=transformers.data.datasets",
+    "--exclude-module=transformers.data.metrics",
+    "--exclude-module=transformers.data.processors",
+    "--exclude-module=transformers.testing_utils",
+    "--exclude-module=transformers.debug_utils",
+    "--exclude-module=transformers.modeling_tf_utils",
+    "--exclude-module=transformers.modeling_flax_utils",
+    "--exclude-module=transformers.onnx",
+    "--exclude-module=transformers.sagemaker",
+    "--exclude-module=transformers.tools",
+    "--exclude-module=transformers.utils.hub",
+    # Setting PYTHONOPTIMIZE above doesn't reach the running interpreter's
+    # flags, so ask PyInstaller (6.6+) for optimized bytecode directly
+    "--optimize=2",
+    "main.py",
+]
+# Smaller binaries mean less to load at launch.
+# PyInstaller uses UPX when it's on PATH; UPX_DIR points it elsewhere.
+if os.environ.get("UPX_DIR"):
+    PYINSTALLER_ARGS.insert(0, f"--upx-dir={os.environ['UPX_DIR']}")
+# Stripping symbols is not recommended for Windows binaries
+if os.name != "nt":
+    PYINSTALLER_ARGS.insert(0, "--strip")
+# Incremental builds reuse the analysis in build/main; REBUILD_CLEAN=1 throws
+# it away, e.g. after changing packages without touching requirements.txt
+if os.environ.get("REBUILD_CLEAN") == "1":
+    PYINSTALLER_ARGS.insert(0, "--clean")
 
-def copy_folder(src, dst):
+
+def source_fingerprint(root, args):
+    """Hash each .py file's path, mtime and size, requirements.txt and the args."""
+    digest = hashlib.blake2b()
+    digest.update("\0".join(args).encode())
+    for name in FINGERPRINT_FILES:
+        try:
+            with open(os.path.join(root, name), "rb") as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            pass
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        pending.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    st = entry.stat()  # Cached by scandir on Windows
+                    digest.update(
+                        f"{entry.path}|{st.st_mtime_ns}|{st.st_size}\n".encode()
+                    )
+    return digest.hexdigest()
+
+
+def read_build_hash():
+    try:
+        with open(BUILD_HASH_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+# Run PyInstaller to create dist/main, unless nothing changed and the bundle
+# from the last build is still there
+fingerprint = source_fingerprint(".", PYINSTALLER_ARGS)
+if fingerprint == read_build_hash() and os.path.isfile(BUILT_EXECUTABLE):
+    print("Sources unchanged since the last build, skipping PyInstaller.")
+else:
+    # A run that dies after --noconfirm emptied dist/main must not leave a
+    # matching hash behind
+    try:
+        os.remove(BUILD_HASH_FILE)
+    except FileNotFoundError:
+        pass
+    PyInstaller.__main__.run(PYINSTALLER_ARGS)
+    os.makedirs(os.path.dirname(BUILD_HASH_FILE), exist_ok=True)
+    with open(BUILD_HASH_FILE, "w", encoding="utf-8") as f:
+        f.write(fingerprint)
+
+
+class MultithreadedCopier(ThreadPoolExecutor):
+    """copytree copy_function that copies the files on a thread pool."""
+
+    def __init__(self, max_workers=None, copy_function=shutil.copy2):
+        super().__init__(max_workers=max_workers)
+        self.copy_function = copy_function
+        self.copies = []
+
+    def copy(self, src, dst):
+        self.copies.append(self.submit(self.copy_function, src, dst))
+
+
+def mirror_folder(src, dst):
+    """Mirror src into dst with rsync/robocopy, which skip unchanged files.
+
+    Returns False when neither tool is available.
+    """
+    if shutil.which("rsync"):
+        os.makedirs(dst, exist_ok=True)  # rsync only creates the last level
+        subprocess.run(["rsync", "-a", "--delete", f"{src}/", f"{dst}/"], check=True)
+        return True
+    if os.name == "nt" and shutil.which("robocopy"):
+        result = subprocess.run(
+            ["robocopy", src, dst, "/MIR", "/MT:16", "/NFL", "/NDL", "/NJH", "/NJS"]
+        )
+        # robocopy exit codes below 8 all mean success
+        if result.returncode >= 8:
+            raise RuntimeError(f"robocopy failed with exit code {result.returncode}")
+        return True
+    return False
+
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst, copying instead where links aren't possible."""
+    try:
+        if os.path.samefile(src, dst):
+            return  # Already linked by a previous build
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:  # Different file system or no hardlink support
+        shutil.copyfile(src, dst)
+
+
+def copy_folder(src, dst, copy_function=None):
+    # Without a copy_function, rsync/robocopy are preferred over copytree
     try:
         dst = os.path.join(dst, src)
         if not os.path.exists(src):
             print(f"Source folder does not exist: {src}")
             return
 
-        if os.path.exists(dst):
-            print(f"Destination folder already exists. Removing: {dst}")
-            shutil.rmtree(dst)
+        if copy_function is None:
+            if mirror_folder(src, dst):
+                print(f"Folder mirrored successfully from {src} to {dst}")
+                return
+            copy_function = shutil.copy2
 
-        shutil.copytree(src, dst)
+        # Copy into the existing folder instead of deleting and re-walking it
+        with MultithreadedCopier(
+            max_workers=(os.cpu_count() or 1) * 2, copy_function=copy_function
+        ) as copier:
+            shutil.copytree(src, dst, copy_function=copier.copy, dirs_exist_ok=True)
+        for copy in copier.copies:
+            copy.result()  # Re-raise the first failed file copy, if any
         print(f"Folder copied successfully from {src} to {dst}")
     except Exception as e:
         print(f"Error occurred: {e}")
 
 
-# Copy necessary folders to dist/main
+# Copy necessary folders to dist/main; they go to separate subfolders, so
+# both copies run at the same time
 destination_folder = "dist/main"
-copy_folder("machine_models", destination_folder)
-copy_folder("ui/assets", destination_folder)
+with ThreadPoolExecutor(max_workers=2) as executor:
+    # Hardlinking the model weights moves no data at all; they are only read
+    executor.submit(
+        copy_folder,
+        "machine_models",
+        destination_folder,
+        copy_function=link_or_copy,
+    )
+    executor.submit(copy_folder, "ui/assets", destination_folder)
@@ -1,6 +1,5 @@
 from PySide6.QtCore import QTimer, QUrl
 from PySide6.QtMultimedia import QMediaPlayer
-from utils.config import BUFFERING_CHECK_INTERVAL
 from utils.logging_config import setup_logging
 
 
@@ -23,11 +22,11 @@ class MediaController:
         self.volume_button = volume_button
         self.volume_slider = volume_slider
         self.progress_slider = progress_slider
-        self.buffering_check_timer = QTimer()
-        self.buffering_check_timer.setInterval(BUFFERING_CHECK_INTERVAL)
-        self.last_position = 0
-        self.buffering_counter = 0
         self.manual_position_update = False
+        # One restartable timer: a slider drag fires sliderMoved many times
+        self._position_reset_timer = QTimer()
+        self._position_reset_timer.setSingleShot(True)
+        self._position_reset_timer.setInterval(100)
         self._setup_connections()
 
     def _setup_connections(self):
@@ -38,9 +37,9 @@ class MediaController:
         self.progress_slider.sliderMoved.connect(self.set_position)
         self.media_player.durationChanged.connect(self.update_duration)
         self.media_player.positionChanged.connect(self.update_position)
-        self.buffering_check_timer.timeout.connect(self.check_buffering)
         self.media_player.playbackStateChanged.connect(self.handle_playback_state)
         self.media_player.mediaStatusChanged.connect(self.handle_media_status)
+        self._position_reset_timer.timeout.connect(self._reset_position_flag)
 
     def load_video(self, video_path):
         """Load and play a video file."""
@@ -48,7 +47,6 @@ class MediaController:
         self.audio_output.setMuted(False)
         self.media_player.play()
         self.play_button.setText("⏸️")
-        self.buffering_check_timer.start()
 
     def toggle_play_pause(self):
         """Toggle between play and pause states."""
@@ -83,7 +81,7 @@ class MediaController:
         """Set the video position and flag manual update."""
         self.manual_position_update = True
         self.media_player.setPosition(position)
-        QTimer.singleShot(100, self._reset_position_flag)
+        self._position_reset_timer.start()  # Restarts the interval
 
     def _reset_position_flag(self):
         """Reset the manual position update flag."""
@@ -95,41 +93,24 @@ class MediaController:
 
     def update_position(self, position):
         """Update the progress slider position."""
-        if not self.manual_position_update:
+        # Runs on every positionChanged; the root logger is at DEBUG, so a
+        # per-update debug line here would be written out every time
+        if not self.manual_position_update and self.progress_slider.value() != position:
             self.progress_slider.setValue(position)
-            self.logger.debug("Updated position to %d ms", position)
         if (
             position == 0
             and self.media_player.playbackState() == QMediaPlayer.PlayingState
         ):
             self.logger.warning("Video position reset to 0 unexpectedly")
 
-    def check_buffering(self):
-        """Check if the video is buffering."""
-        current_position = self.media_player.position()
-        if (
-            current_position == self.last_position
-            and self.media_player.playbackState() == QMediaPlayer.PlayingState
-        ):
-            self.buffering_counter += 1
-            if self.buffering_counter >= 3:
-                self._showBuffering(True)
-        else:
-            self.buffering_counter = 0
-            self._showBuffering(False)
-        self.last_position = current_position
-
     def handle_playback_state(self, state):
         """Handle playback state changes."""
         if state == QMediaPlayer.PlayingState:
-            self.buffering_check_timer.start()
             if self._is_buffering_visible():
                 QTimer.singleShot(500, lambda: self._showBuffering(False))
         elif state == QMediaPlayer.PausedState:
-            self.buffering_check_timer.stop()
             self._showBuffering(False)
         elif state == QMediaPlayer.StoppedState:
-            self.buffering_check_timer.stop()
             self._showBuffering(False)
 
     def handle_media_status(self, status):
@@ -156,5 +137,4 @@ class MediaController:
         """Stop media playback and cleanup."""
         self.media_player.stop()
         self.audio_output.setMuted(True)
-        self.buffering_check_timer.stop()
         self._showBuffering(False)
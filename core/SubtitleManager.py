@@ -1,13 +1,82 @@
-from filelock import FileLock, Timeout
+from bisect import bisect_left, bisect_right
 from PySide6.QtMultimedia import QMediaPlayer
 from services.utils.context_manager import ContextManager
-from utils.config import SUBTITLE_UPDATE_INTERVAL
 from utils.logging_config import setup_logging
-from os import path
-from re import match, search
-from PySide6.QtCore import QTimer
+from os import stat
+from os.path import dirname
+import re
+from PySide6.QtCore import (
+    QFileSystemWatcher,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import QGraphicsTextItem
 
+# "[start-end] text" lines of the legacy plain-text transcript
+_LINE_RE = re.compile(r"\s*\[\s*([\d.]+)\s*-\s*([\d.]+)\s*\]\s*(.*)")
+_SRT_TIME_RE = re.compile(r"\d{2}:\d{2}:\d{2},\d{3} -->")
+# The first timing line is near the top; don't scan a whole non-SRT transcript
+_SRT_DETECT_LIMIT = 4096
+# One whole SRT block: index line, timing line with every field captured
+# separately, then the text up to the next blank line. Lines are anchored so
+# malformed blocks fail fast and are skipped.
+_SRT_BLOCK_RE = re.compile(
+    r"^\d+[ \t]*\n"
+    r"(\d{2}):(\d{2}):(\d{2}),(\d{3}) --> (\d{2}):(\d{2}):(\d{2}),(\d{3})[ \t]*\n"
+    r"(.*?)(?=\n[ \t]*\n|\Z)",
+    re.DOTALL | re.MULTILINE,
+)
+
+
+class _TranscriptReaderSignals(QObject):
+    # (generation, (reset, mtime_ns, offset, parsed) or None if there was nothing to read)
+    read = Signal(int, object)
+
+
+class _TranscriptReader(QRunnable):
+    """Reads and parses the transcript from `offset` to the end off the UI thread."""
+
+    def __init__(self, subtitle_manager, transcript_file, generation, state, signals):
+        super().__init__()
+        self.subtitle_manager = subtitle_manager
+        self.transcript_file = transcript_file
+        self.generation = generation
+        # (offset, mtime_ns, pending bytes) as of the previous read
+        self.state = state
+        self.signals = signals
+
+    def run(self):
+        result = None
+        try:
+            offset, mtime_ns, pending = self.state
+            st = stat(self.transcript_file)
+            if st.st_size != offset or st.st_mtime_ns != mtime_ns:
+                reset = st.st_size < offset
+                if reset:  # Truncated or replaced: start over
+                    offset, pending = 0, b""
+                # Unbuffered: read() sizes itself from fstat and fetches the whole
+                # remainder in one go, without copying through an 8 KiB buffer
+                with open(self.transcript_file, "rb", buffering=0) as f:
+                    f.seek(offset)
+                    data = f.read()
+                result = (
+                    reset,
+                    st.st_mtime_ns,
+                    offset + len(data),
+                    self.subtitle_manager._split_transcript(pending + data),
+                )
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.subtitle_manager.logger.error(
+                "Error reading transcription: %s", str(e)
+            )
+        self.signals.read.emit(self.generation, result)
+
 
 class SubtitleManager:
     """Manages subtitle parsing and display."""
@@ -24,92 +93,238 @@ class SubtitleManager:
         self.subtitle_text = subtitle_text
         self.update_subtitle_position = update_subtitle_position
         self.timer = timer
-        self.transcript_segments = []
+        # Segments kept as parallel lists sorted by start time so the current
+        # subtitle can be found with a binary search on every tick. Times are
+        # integer milliseconds, the unit of QMediaPlayer.position().
+        self._starts = []
+        self._ends = []
+        self._texts = []
+        self._last_segment_index = -1
+        # Incremental reading of the append-only transcript file
+        self._transcript_offset = 0
+        self._transcript_mtime_ns = None
+        self._pending_transcript = b""
+        self._tail_segment = None
+        # Reads run on the thread pool, one at a time; a change noticed while
+        # one is in flight is read right after it
+        self._transcript_file = None
+        self._read_generation = 0
+        self._read_in_flight = False
+        self._read_requested = False
+        self._reader_signals = _TranscriptReaderSignals()
+        self._reader_signals.read.connect(self._on_transcript_read, Qt.QueuedConnection)
+        self._shown_text = ""  # Text currently set on subtitle_text
+        # Segment index behind _shown_text (-1 for none); None forces a recheck
+        self._shown_index = None
         self.waiting_for_subtitle = True
         self.is_transcription_complete = False
-        self.update_counter = 0
-        self.update_interval = SUBTITLE_UPDATE_INTERVAL
-
-        self.timer.timeout.connect(self.check_subtitle)
+        # Re-read the transcript when it changes instead of polling it
+        self._watcher = QFileSystemWatcher()
+        self._watcher.fileChanged.connect(self._on_transcript_changed)
+        self._watcher.directoryChanged.connect(self._on_transcript_changed)
 
     def load_initial_transcription(self):
-        """Load initial transcription from file."""
+        """Load initial transcription from file on a pool thread."""
 
-        transcript_file = ContextManager.get_transcript_file()
-        try:
-            if path.exists(transcript_file):
-                with open(transcript_file, "r", encoding="utf-8") as f:
-                    self.parse_srt_transcription(f.read())
-                self.logger.info(
-                    "Loaded initial SRT transcription from %s", transcript_file
-                )
-        except Exception as e:
-            self.logger.error("Error reading initial transcription: %s", str(e))
+        self._transcript_file = ContextManager.get_transcript_file()
+        self._reset_transcript_state()
+        # Results of reads started for the previous video are dropped
+        self._read_generation += 1
+        self._read_in_flight = False
+        self._watch_transcript(self._transcript_file)
+        self._start_read()
+
+    def _start_read(self):
+        self._read_in_flight = True
+        self._read_requested = False
+        QThreadPool.globalInstance().start(
+            _TranscriptReader(
+                self,
+                self._transcript_file,
+                self._read_generation,
+                (
+                    self._transcript_offset,
+                    self._transcript_mtime_ns,
+                    self._pending_transcript,
+                ),
+                self._reader_signals,
+            )
+        )
+
+    def _on_transcript_read(self, generation, result):
+        """Install the segments read by _TranscriptReader (runs on the UI thread)."""
+        if generation != self._read_generation:
+            return  # A different video was loaded in the meantime
+        self._read_in_flight = False
+        if result is not None:
+            reset, mtime_ns, offset, (new_segments, tail_segments, pending) = result
+            if reset:
+                self._reset_transcript_state()
+            self._transcript_mtime_ns = mtime_ns
+            self._transcript_offset = offset
+            self._pending_transcript = pending
+            self._add_parsed_segments(new_segments, tail_segments)
+            # Watch the file itself once it exists, and again after it's replaced
+            if self._transcript_file not in self._watcher.files():
+                self._watcher.addPath(self._transcript_file)
+            # Playback may be paused waiting for exactly these segments, in which
+            # case no positionChanged would come to re-check them
+            self.check_subtitle()
+        if self._read_requested:
+            self._start_read()
+
+    def _watch_transcript(self, transcript_file):
+        """Watch the transcript's folder, which notices the file being created."""
+        watched = self._watcher.files() + self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        self._watcher.addPath(dirname(transcript_file) or ".")
+
+    def _on_transcript_changed(self, _path):
+        self.refresh_transcription()
+
+    def _reset_transcript_state(self):
+        """Forget loaded segments and start reading the transcript from the top."""
+        self._set_segments([])
+        self._last_segment_index = -1
+        self._transcript_offset = 0
+        self._transcript_mtime_ns = None
+        self._pending_transcript = b""
+        self._tail_segment = None
+
+    def _split_transcript(self, buffer):
+        """Parse SRT bytes into (complete segments, tail segments, pending bytes).
+
+        Blocks are separated by a blank line, which the writer only adds in
+        front of the next block. The newest block is therefore shown as soon as
+        its text line is complete, but kept pending and replaced on the next
+        read in case it was only partly written.
+        """
+        buffer = buffer.replace(b"\r\n", b"\n")
+        split_at = buffer.rfind(b"\n\n")
+        if split_at >= 0:
+            complete, tail = buffer[: split_at + 2], buffer[split_at + 2 :]
+        else:
+            complete, tail = b"", buffer
+
+        new_segments = self._parse_srt_blocks(complete.decode("utf-8"))
+        tail_segments = []
+        if tail.endswith(b"\n"):
+            tail_segments = self._parse_srt_blocks(tail.decode("utf-8"))
+        return new_segments, tail_segments, tail
+
+    def _add_parsed_segments(self, new_segments, tail_segments):
+        """Append parsed segments, replacing the previously pending tail block."""
+        self._shown_index = None  # Indexes and the tail's text may shift
+        if self._tail_segment is not None:
+            self._remove_segment(self._tail_segment)
+        self._tail_segment = tail_segments[-1] if tail_segments else None
+
+        new_segments = new_segments + tail_segments
+        if new_segments:
+            self._append_segments(new_segments)
+            self.logger.debug("Loaded %d new SRT segments", len(new_segments))
 
     def parse_srt_transcription(self, transcription):
         """Parse SRT transcription text into segments."""
+        new_segments = self._parse_srt_blocks(transcription)
+        if new_segments:
+            self._set_segments(new_segments)
+            self.logger.debug("Refreshed with %d SRT segments", len(new_segments))
+
+    def _parse_srt_blocks(self, transcription):
+        """Parse SRT text into a list of (start, end, text) tuples."""
         new_segments = []
-        subtitle_blocks = transcription.strip().split("\n\n")
-        for block in subtitle_blocks:
-            if not block.strip():
+        # A single pass over the text instead of splitting it into blocks and lines
+        for block_match in _SRT_BLOCK_RE.finditer(transcription):
+            text = block_match[9].strip()
+            if not text:
                 continue
-            lines = block.strip().split("\n")
-            if len(lines) < 3:
-                continue
-            try:
-                _ = int(lines[0])
-                time_line = lines[1]
-                time_match = match(
-                    r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})",
-                    time_line,
-                )
-                if not time_match:
-                    self.logger.error(f"Invalid time format in line: {time_line}")
-                    continue
-                start_time = self._srt_time_to_seconds(time_match.group(1))
-                end_time = self._srt_time_to_seconds(time_match.group(2))
-                text = "\n".join(lines[2:])
-                new_segments.append(
-                    {"start": start_time, "end": end_time, "text": text.strip()}
+            # Integer milliseconds computed inline, no helper call per timestamp
+            h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, block_match.group(*range(1, 9)))
+            new_segments.append(
+                (
+                    h1 * 3_600_000 + m1 * 60_000 + s1 * 1000 + ms1,
+                    h2 * 3_600_000 + m2 * 60_000 + s2 * 1000 + ms2,
+                    text,
                 )
-            except ValueError as e:
-                self.logger.error(
-                    f"Error parsing SRT block: {block[:50]}... - {str(e)}"
-                )
-                continue
-        if new_segments:
-            self.transcript_segments = new_segments
-            self.logger.debug(f"Refreshed with {len(new_segments)} SRT segments")
+            )
+        return new_segments
 
-    def _srt_time_to_seconds(self, srt_time):
-        """Convert SRT time format (HH:MM:SS,mmm) to seconds."""
-        time_part, ms_part = srt_time.split(",")
-        hours, minutes, seconds = map(int, time_part.split(":"))
-        milliseconds = int(ms_part)
-        return hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
+    def _set_segments(self, segments):
+        """Store (start, end, text) tuples as parallel lists sorted by start."""
+        segments.sort(key=lambda segment: segment[0])
+        self._shown_index = None
+        self._starts = [segment[0] for segment in segments]
+        self._ends = [segment[1] for segment in segments]
+        self._texts = [segment[2] for segment in segments]
+
+    def _append_segments(self, segments):
+        """Add (start, end, text) tuples, keeping the lists sorted by start."""
+        segments.sort(key=lambda segment: segment[0])
+        if self._starts and segments[0][0] < self._starts[-1]:
+            self._set_segments(
+                list(zip(self._starts, self._ends, self._texts)) + segments
+            )
+            return
+        self._starts.extend(segment[0] for segment in segments)
+        self._ends.extend(segment[1] for segment in segments)
+        self._texts.extend(segment[2] for segment in segments)
+
+    def _remove_segment(self, segment):
+        """Remove one (start, end, text) tuple from the lists if present."""
+        start, end, text = segment
+        index = bisect_left(self._starts, start)
+        while index < len(self._starts) and self._starts[index] == start:
+            if self._ends[index] == end and self._texts[index] == text:
+                del self._starts[index], self._ends[index], self._texts[index]
+                return
+            index += 1
 
     def parse_transcription(self, transcription):
         """Parse transcription text into segments (legacy method)."""
-        if "-->" in transcription and search(r"\d{2}:\d{2}:\d{2},\d{3}", transcription):
+        if _SRT_TIME_RE.search(transcription, 0, _SRT_DETECT_LIMIT):
             self.parse_srt_transcription(transcription)
         else:
-            new_segments = []
-            for line in transcription.strip().split("\n"):
-                if line:
-                    try:
-                        time_str, text = line.split("]", 1)
-                        time_str = time_str[1:]
-                        start_str, end_str = time_str.split("-")
-                        start = float(start_str.strip())
-                        end = float(end_str.strip())
-                        new_segments.append(
-                            {"start": start, "end": end, "text": text.strip()}
-                        )
-                    except Exception as e:
-                        self.logger.error(f"Error parsing transcription line: %s", line)
-                        continue
+            new_segments = self._parse_lines(transcription.splitlines())
             if new_segments:
-                self.transcript_segments = new_segments
+                self._set_segments(new_segments)
+
+    def _parse_lines(self, lines):
+        """Parse "[start-end] text" lines into a list of (start, end, text) tuples."""
+        new_segments = []
+        for line in lines:
+            if not line:
+                continue
+            line_match = _LINE_RE.match(line)
+            if not line_match:
+                self.logger.error("Error parsing transcription line: %s", line)
+                continue
+            start, end, text = line_match.groups()
+            try:
+                new_segments.append(
+                    (round(float(start) * 1000), round(float(end) * 1000), text.strip())
+                )
+            except ValueError:
+                self.logger.error("Error parsing transcription line: %s", line)
+        return new_segments
+
+    def _segment_index_at(self, current_time):
+        """Index of the last segment starting at or before current_time (ms), or -1."""
+        starts = self._starts
+        count = len(starts)
+        # Playback moves forward, so it's nearly always the same or the next one
+        for index in (self._last_segment_index, self._last_segment_index + 1):
+            if (
+                0 <= index < count
+                and starts[index] <= current_time
+                and (index + 1 == count or current_time < starts[index + 1])
+            ):
+                self._last_segment_index = index
+                return index
+        # Seeked, or the segments changed: fall back to a binary search
+        self._last_segment_index = bisect_right(starts, current_time) - 1
+        return self._last_segment_index
 
     def set_transcription_complete(self):
         """Mark transcription as complete."""
@@ -117,35 +332,39 @@ class SubtitleManager:
         self.logger.info("Transcription marked as complete")
         self.check_subtitle()
 
-    def check_subtitle(self):
-        """Update subtitle display and manage playback."""
-        current_time = self.media_player.position() / 1000.0
-        current_text = ""
-        found_subtitle = False
+    def check_subtitle(self, position=None):
+        """Update subtitle display and manage playback.
 
-        for segment in self.transcript_segments:
-            if segment["start"] <= current_time <= segment["end"]:
-                current_text = segment["text"]
-                found_subtitle = True
-                break
+        `position` is the player position in ms; it is read from the player
+        when not given.
+        """
+        current_time = self.media_player.position() if position is None else position
 
-        if found_subtitle:
-            if self.subtitle_text.toPlainText() != current_text:
+        # Last segment starting at or before now; it's the only candidate
+        index = self._segment_index_at(current_time)
+        if index < 0 or current_time > self._ends[index]:
+            index = -1
+        found_subtitle = index >= 0
+
+        # Most calls land on the segment already shown: an integer compare
+        # skips the text lookup and string compare
+        if index != self._shown_index:
+            self._shown_index = index
+            current_text = self._texts[index] if found_subtitle else ""
+            # Compare with the text we last set instead of reading it back from Qt
+            if current_text != self._shown_text:
+                self._shown_text = current_text
                 self.subtitle_text.setPlainText(current_text)
                 self.update_subtitle_position()
-        else:
-            if self.subtitle_text.toPlainText() != "":
-                self.subtitle_text.setPlainText("")
-                self.update_subtitle_position()
 
         current_playback_state = self.media_player.playbackState()
 
         # Handle playback based on subtitle availability and transcription status
         if not self.is_transcription_complete and not found_subtitle:
             # No subtitle for current time and transcription is ongoing
-            if self.transcript_segments:
+            if self._starts:
                 # Check if we're past the last known segment
-                last_segment_end = self.transcript_segments[-1]["end"]
+                last_segment_end = self._ends[-1]
                 if (
                     current_time >= last_segment_end
                     and current_playback_state == QMediaPlayer.PlayingState
@@ -153,10 +372,12 @@ class SubtitleManager:
                     self.media_player.pause()
                     self.waiting_for_subtitle = True
                     self.logger.info(
-                        f"Paused at {current_time:.2f}s: No subtitle available, past last segment ({last_segment_end:.2f}s)."
+                        "Paused at %.2fs: No subtitle available, past last segment (%.2fs).",
+                        current_time / 1000,
+                        last_segment_end / 1000,
                     )
             elif (
-                current_time > 0.2
+                current_time > 200
                 and current_playback_state == QMediaPlayer.PlayingState
             ):
                 # No segments at all, and we're past initial startup
@@ -177,29 +398,11 @@ class SubtitleManager:
                     "Subtitle found" if found_subtitle else "Transcription complete",
                 )
 
-        self.update_counter += 1
-        if self.update_counter >= self.update_interval:
-            self.update_counter = 0
-            self.refresh_transcription()
-
     def refresh_transcription(self):
-        """Refresh transcription from file."""
-        try:
-            transcript_file = ContextManager.get_transcript_file()
-            transcript_lock_file = ContextManager.get_transcript_file(is_lock=True)
-        except AttributeError:
-            print("ContextManager is not initialized yet.")
-        try:
-            if not path.exists(transcript_file):
-                return
-            lock = FileLock(transcript_lock_file, timeout=0.5)
-            with lock:
-                with open(transcript_file, "r", encoding="utf-8") as f:
-                    self.parse_srt_transcription(f.read())
-        except Timeout:
-            self.logger.warning(
-                "Transcription file locked during refresh, will retry later."
-            )
+        """Read what was appended to the transcript, on a pool thread."""
+        if self._transcript_file is None:
+            return  # No video loaded yet
+        if self._read_in_flight:
+            self._read_requested = True
             return
-        except Exception as e:
-            self.logger.error(f"Error refreshing transcription: %s", str(e))
+        self._start_read()
@@ -1,12 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PySide6.QtCore import Signal, QTimer
+from PySide6.QtMultimedia import QMediaPlayer
 from ui.views.video_view import VideoPlayerUI
 from core.MediaController import MediaController
 from core.SubtitleManager import SubtitleManager
+from utils.config import (
+    SEEK_BUFFERING_DELAY,
+    SUBTITLE_FALLBACK_INTERVAL,
+    WORKER_STOP_TIMEOUT,
+)
 from utils.logging_config import setup_logging
 
 
 class VideoPlayerLogic(VideoPlayerUI):
     switch_scene_signal = Signal(str)
+    _cancel_finished = Signal()
 
     def __init__(self, main_window, transcription_server):
         super().__init__(main_window)
@@ -17,7 +26,22 @@ class VideoPlayerLogic(VideoPlayerUI):
         self.task_id = None
         self.src_lang = None
         self.tgt_lang = None
+        # Stopping the worker blocks on HTTP calls and a thread join, so it runs
+        # on one long-lived thread; a second click while it runs is ignored
+        self._cancel_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="cancel"
+        )
+        self._cancel_future = None
+        self._closing = False
+        self._shown_position_sec = None  # Seconds currently on the time label
+        self._show_hours = False
+        self._duration_text = self.format_time(0, False)
         self.timer = QTimer()
+        # Only show buffering for seeks that haven't landed after a short delay
+        self._seek_buffering_timer = QTimer(self)
+        self._seek_buffering_timer.setSingleShot(True)
+        self._seek_buffering_timer.setInterval(SEEK_BUFFERING_DELAY)
+        self._stream_buffering = False  # Player reports a partly filled buffer
         self.media_controller = MediaController(
             self.media_player,
             self.audio_output,
@@ -36,16 +60,43 @@ class VideoPlayerLogic(VideoPlayerUI):
         self._setup_connections()
         self.audio_output.setVolume(0.5)
         self.media_controller.update_volume_icon(50)
-        self.timer.start(100)
+        self.timer.start(SUBTITLE_FALLBACK_INTERVAL)
 
     def _setup_connections(self):
         """Connect signals for scene switching and transcription cancellation."""
         self.rewind_button.clicked.connect(self.rewind_video)
         self.forward_button.clicked.connect(self.forward_video)
         self.cancel_button.clicked.connect(self.cancel_transcription)
+        self.timer.timeout.connect(self._on_tick)
+        self._seek_buffering_timer.timeout.connect(self.showBuffering)
         self.switch_scene_signal.connect(self.main_window.switch_to_welcome_view)
+        self._cancel_finished.connect(self._on_cancel_finished)
+        # Subtitles follow the player's own position updates, so nothing runs
+        # while paused; the timer is only a low-frequency fallback
+        self.media_player.positionChanged.connect(self.subtitle_manager.check_subtitle)
+        self.media_player.positionChanged.connect(self._end_seek_buffering)
+        self.media_player.bufferProgressChanged.connect(self._on_buffer_progress)
         self.media_player.positionChanged.connect(self.update_time_label)
-        self.media_player.durationChanged.connect(self.update_time_label)
+        self.media_player.durationChanged.connect(self.update_duration)
+        self.media_player.mediaStatusChanged.connect(self._on_media_status)
+
+    def _on_tick(self):
+        """Fallback tick: pick up missed transcript changes and re-check the subtitle."""
+        self.subtitle_manager.refresh_transcription()
+        # While paused the position can only change through a seek, which
+        # emits positionChanged; unless playback waits for a subtitle to resume
+        # there is nothing for the tick to check
+        if (
+            self.media_player.playbackState() != QMediaPlayer.PlayingState
+            and not self.subtitle_manager.waiting_for_subtitle
+        ):
+            return
+        self.subtitle_manager.check_subtitle(self.media_player.position())
+
+    def _on_media_status(self, status):
+        """Lay out the scene once the new media is loaded and its geometry known."""
+        if status == QMediaPlayer.LoadedMedia:
+            self.updateSceneRect()
 
     def load_video(self, video_path):
         """Load video and initialize transcription."""
@@ -57,8 +108,6 @@ class VideoPlayerLogic(VideoPlayerUI):
         )
         self.media_controller.load_video(video_path)
         self.subtitle_manager.load_initial_transcription()
-        QTimer.singleShot(100, self.updateSceneRect)
-        QTimer.singleShot(500, self.updateSceneRect)
         if self.transcription_worker:
             self.transcription_worker.finished.connect(
                 self.subtitle_manager.set_transcription_complete
@@ -66,47 +115,110 @@ class VideoPlayerLogic(VideoPlayerUI):
 
     def cancel_transcription(self):
         """Cancel transcription and switch to scene 1 after cleanup."""
+        if self._cancel_future is not None:
+            return self._cancel_future
         self.logger.info("Cancelling transcription and switching to scene 1")
         self.media_controller.stop()
-        if self.transcription_worker:
-            self.transcription_worker.stop()
-            self.transcription_worker.wait()
-            self.logger.info("Transcription worker stopped")
         self.task_id = None
-        if self.transcription_server:
-            self.transcription_server.cleanup()
-            self.logger.info("Transcription server cleaned up")
+        self._cancel_future = self._cancel_pool.submit(
+            self._shutdown_transcription, self.transcription_worker
+        )
+        return self._cancel_future
+
+    def shutdown_transcription(self):
+        """Cancel transcription and block until the worker and server are cleaned up.
+
+        Used when the window closes: the server must not be stopped, nor the
+        worker thread destroyed, while the cancellation is still running.
+        """
+        self._closing = True
+        self.cancel_transcription().result()
+        self.transcription_worker = None
+        self._cancel_future = None
+
+    def _shutdown_transcription(self, transcription_worker):
+        """Stop the worker and clean up the server off the UI thread."""
+        try:
+            if transcription_worker:
+                transcription_worker.stop()
+                if transcription_worker.wait(WORKER_STOP_TIMEOUT):
+                    self.logger.info("Transcription worker stopped")
+                else:
+                    self.logger.warning(
+                        "Transcription worker still running after %d ms",
+                        WORKER_STOP_TIMEOUT,
+                    )
+            if self.transcription_server:
+                self.transcription_server.cleanup()
+                self.logger.info("Transcription server cleaned up")
+        except Exception as e:
+            self.logger.error("Error while cancelling transcription: %s", str(e))
+        finally:
+            # Queued to the UI thread, which owns the worker and the window
+            if not self._closing:
+                self._cancel_finished.emit()
+
+    def _on_cancel_finished(self):
+        """Runs on the UI thread once a cancellation has been cleaned up."""
+        if self._closing:
+            return
+        self.transcription_worker = None
+        self._cancel_future = None
         self.switch_scene_signal.emit("Cancelled")
 
     def rewind_video(self):
         """Rewind video by 5 seconds."""
         position = self.media_player.position()
-        self.showBuffering(True)
+        self._seek_buffering_timer.start()
         self.media_player.setPosition(max(0, position - 5000))
-        self.showBuffering(False)
         self.logger.debug("Rewinded video by 5 seconds")
 
     def forward_video(self):
         """Fast forward video by 5 seconds."""
         position = self.media_player.position()
         duration = self.media_player.duration()
-        self.showBuffering(True)
+        self._seek_buffering_timer.start()
         self.media_player.setPosition(min(duration, position + 5000))
-        self.showBuffering(False)
         self.logger.debug("Fast forwarded video by 5 seconds")
 
+    def _end_seek_buffering(self):
+        """The player reported a position, so any pending seek has landed."""
+        if self._seek_buffering_timer.isActive():
+            self._seek_buffering_timer.stop()
+        # A stalled stream keeps its indicator until the buffer fills up
+        elif self.is_buffering_visible() and not self._stream_buffering:
+            self.showBuffering(False)
+
+    def _on_buffer_progress(self, progress):
+        """Show buffering while the player reports a partly filled buffer."""
+        self._stream_buffering = progress < 1.0
+        self.showBuffering(self._stream_buffering)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def format_time(seconds, show_hours):
+        """Format whole seconds as MM:SS, or HH:MM:SS when show_hours is set."""
+        if show_hours:
+            return f"{seconds // 3600:02}:{(seconds % 3600) // 60:02}:{seconds % 60:02}"
+        return f"{(seconds % 3600) // 60:02}:{seconds % 60:02}"
+
+    def update_duration(self, duration):
+        """Format the duration once; only the position changes while playing."""
+        duration_sec = duration // 1000
+        self._show_hours = duration_sec >= 3600
+        self._duration_text = self.format_time(duration_sec, self._show_hours)
+        self._shown_position_sec = None
+        self.update_time_label()
+
     def update_time_label(self):
         """Update the time label with current position and duration."""
         position_sec = self.media_player.position() // 1000
-        duration_sec = self.media_player.duration() // 1000
-        show_hours = duration_sec >= 3600
-        time_format = lambda s: (
-            f"{s // 3600:02}:{(s % 3600) // 60:02}:{s % 60:02}"
-            if show_hours
-            else f"{(s % 3600) // 60:02}:{s % 60:02}"
-        )
+        # positionChanged fires several times a second; the label shows seconds
+        if position_sec == self._shown_position_sec:
+            return
+        self._shown_position_sec = position_sec
         self.time_label.setText(
-            f"{time_format(position_sec)} / {time_format(duration_sec)}"
+            f"{self.format_time(position_sec, self._show_hours)} / {self._duration_text}"
         )
         self.logger.debug("Updated time label")
 
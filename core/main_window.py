@@ -20,21 +20,28 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.stacked_widget)
         self.welcome_view = Welcome(self)
         self.upload_view = Upload(self, self.transcription_server)
-        self.video_player = VideoPlayerLogic(
-            main_window=self,
-            transcription_server=self.transcription_server,
-        )
+        # Created on first use, so startup doesn't set up a media pipeline
+        self.video_player = None
         self.stacked_widget.addWidget(self.welcome_view)
         self.stacked_widget.addWidget(self.upload_view)
-        self.stacked_widget.addWidget(self.video_player)
+
+    def ensure_video_player(self):
+        """Create the video player view the first time it's needed."""
+        if self.video_player is None:
+            self.video_player = VideoPlayerLogic(
+                main_window=self,
+                transcription_server=self.transcription_server,
+            )
+            self.stacked_widget.addWidget(self.video_player)
+        return self.video_player
 
     def closeEvent(self, event: QEvent):
         """Handle window close event to clean up resources."""
         try:
-            if hasattr(self, "video_player"):
+            if getattr(self, "video_player", None) is not None:
                 self.video_player.media_player.stop()
                 self.video_player.audio_output.setMuted(True)
-                self.video_player.cancel_transcription()
+                self.video_player.shutdown_transcription()
             if hasattr(self, "transcription_server"):
                 self.logger.info("Stopping transcription server")
                 self.transcription_server.stop()
@@ -70,10 +77,11 @@ class MainWindow(QMainWindow):
     def switch_to_video_player(self, path, src_lang, tgt_lang):
         """Switch to VideoPlayer and load the video."""
         try:
-            self.video_player.task_id = self.upload_view.transcription_worker.task_id
-            self.video_player.src_lang = src_lang
-            self.video_player.tgt_lang = tgt_lang
-            self.video_player.load_video(path)
+            video_player = self.ensure_video_player()
+            video_player.task_id = self.upload_view.transcription_worker.task_id
+            video_player.src_lang = src_lang
+            video_player.tgt_lang = tgt_lang
+            video_player.load_video(path)
             self.stacked_widget.setCurrentIndex(self.views.index("video_player"))
             self.logger.info(
                 "Switched to VideoPlayer with video: %s, src_lang: %s, tgt_lang: %s",
@@ -1,7 +1,23 @@
 import sys
 import site
 import os
-import subprocess
+
+# Frozen builds remember the site-packages they found next to the executable,
+# so later launches check one path instead of searching again
+SITE_PACKAGES_CACHE = os.path.join(
+    os.path.dirname(sys.executable), "site_packages_path.txt"
+)
+
+# Usual Windows install locations of a system Python, in search order
+_username = os.getenv("USERNAME")
+PYTHON_INSTALL_BASES = (
+    f"C:\\Users\\{_username}\\AppData\\Local\\Programs\\Python\\Python311",
+    f"C:\\Users\\{_username}\\AppData\\Local\\Programs\\Python\\Python312",
+    f"C:\\Users\\{_username}\\AppData\\Local\\Programs\\Python\\Python310",
+    "C:\\Python311",
+    "C:\\Python312",
+    "C:\\Python310",
+)
 
 
 def get_external_site_packages():
@@ -18,68 +34,99 @@ def get_external_site_packages():
             if os.path.exists(path) and "_MEI" not in path and "Roaming" not in path:
                 return path
 
+        # Nothing usable in development: search like a frozen build, but
+        # without the cache that lives next to the executable
+        return find_system_site_packages()
+
+    cached_path = read_cached_site_packages()
+    if cached_path:
+        print(f"Found via cache: {cached_path}")
+        return cached_path
+
+    path = find_system_site_packages()
+    if path:
+        write_cached_site_packages(path)
+    return path
+
+
+def read_cached_site_packages():
+    """Return the cached site-packages path if it still exists."""
+    try:
+        with open(SITE_PACKAGES_CACHE, "r", encoding="utf-8") as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    return path if path and os.path.isdir(path) else None
+
+
+def write_cached_site_packages(path):
+    try:
+        with open(SITE_PACKAGES_CACHE, "w", encoding="utf-8") as f:
+            f.write(path)
+    except OSError:
+        pass  # e.g. installed to a read-only folder; search again next time
+
+
+def find_registry_site_packages():
+    """Look up site-packages of the same Python version in the Windows registry"""
+    try:
+        import winreg
+    except ImportError:
+        return None  # Not on Windows
+    # Compiled packages only load into the Python version they were built for
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    key = f"Software\\Python\\PythonCore\\{version}\\InstallPath"
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            install_path = winreg.QueryValue(hive, key)
+        except OSError:
+            continue
+        path = os.path.join(install_path, "Lib", "site-packages")
+        if os.path.isdir(path):
+            return path
+    return None
+
+
+def find_system_site_packages():
+    """Search for the site-packages of a system Python installation"""
     # For frozen executables, try to find system Python
     print("Frozen executable detected, searching for system Python...")
 
-    # Method 1: Try subprocess to get site-packages from system Python
-    try:
-        result = subprocess.run(
-            'python -c "import site; print(site.getsitepackages()[1])"',
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            path = result.stdout.strip()
-            if os.path.exists(path):
-                print(f"Found via subprocess: {path}")
-                return path
-    except:
-        pass
-
-    # Method 2: Check common installation paths
-    username = os.getenv("USERNAME")
-    common_paths = [
-        f"C:\\Users\\{username}\\AppData\\Local\\Programs\\Python\\Python311\\Lib\\site-packages",
-        f"C:\\Users\\{username}\\AppData\\Local\\Programs\\Python\\Python312\\Lib\\site-packages",
-        f"C:\\Users\\{username}\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages",
-        "C:\\Python311\\Lib\\site-packages",
-        "C:\\Python312\\Lib\\site-packages",
-        "C:\\Python310\\Lib\\site-packages",
-    ]
-
-    for path in common_paths:
-        if os.path.exists(path):
+    # Method 1: Ask the registry where the matching system Python lives,
+    # instead of starting an interpreter just to print its site-packages
+    path = find_registry_site_packages()
+    if path:
+        print(f"Found via registry: {path}")
+        return path
+
+    # Method 2: Check common installation paths, each stat'ed once
+    for base in PYTHON_INSTALL_BASES:
+        path = os.path.join(base, "Lib", "site-packages")
+        if os.path.isdir(path):
             print(f"Found via common paths: {path}")
             return path
 
-    # Method 3: Your original fallback logic (but fixed)
-    try:
-        # Don't use the bundle directory, use a system directory
-        if getattr(sys, "frozen", False):
-            # Try to find Python installation
-            possible_bases = [
-                "C:\\Python311",
-                "C:\\Python312",
-                "C:\\Python310",
-                f"C:\\Users\\{username}\\AppData\\Local\\Programs\\Python\\Python311",
-                f"C:\\Users\\{username}\\AppData\\Local\\Programs\\Python\\Python312",
-            ]
-
-            for base in possible_bases:
-                if os.path.exists(base):
-                    site_packages = os.path.join(base, "Lib", "site-packages")
-                    if os.path.exists(site_packages):
-                        print(f"Found via base search: {site_packages}")
-                        return site_packages
-    except:
-        pass
-
     print("Could not find external site-packages")
     return None
 
 
+def path_key(path):
+    """Normalize a sys.path entry so C:/x, C:\\x and c:\\x\\ compare equal"""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def dedupe_sys_path():
+    """Drop repeated sys.path entries so imports don't search a folder twice"""
+    seen = set()
+    unique = []
+    for path in sys.path:
+        key = path_key(path)
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    sys.path[:] = unique
+
+
 # Your original code structure, but with better detection
 external_site_packages_base = get_external_site_packages()
 
@@ -90,40 +137,40 @@ if external_site_packages_base:
 
     print(f"Using external site-packages: {external_site_packages}")
 
-    if external_site_packages not in sys.path:
+    if path_key(external_site_packages) not in map(path_key, sys.path):
         sys.path.insert(0, external_site_packages)
+        dedupe_sys_path()
         print("Added to sys.path successfully")
 
-        # List contents to verify
-        if os.path.exists(external_site_packages):
+        # List contents to verify; scandir already knows which entries are
+        # folders, so nothing is stat'ed again
+        try:
+            with os.scandir(external_site_packages) as entries:
+                items = [(entry.name, entry.is_dir()) for entry in entries]
+        except OSError:
+            items = None
+        if items is not None:
             print("Installed libraries in site-packages:")
-            items = os.listdir(external_site_packages)
 
             # Show important packages first
-            important = ["torch", "numpy", "cv2", "PIL", "torchvision"]
+            important = ["torch", "numpy", "cv2", "pil", "torchvision"]
             found_important = []
+            other_count = 0
 
-            for item in items:
-                for imp in important:
-                    if imp.lower() in item.lower():
-                        full_path = os.path.join(external_site_packages, item)
-                        if os.path.isdir(full_path):
-                            found_important.append(f"  ✓ {item} (directory)")
-                        else:
-                            found_important.append(f"  ✓ {item} (file)")
-                        break
+            for item, is_dir in items:
+                lowered = item.lower()
+                if any(imp in lowered for imp in important):
+                    kind = "directory" if is_dir else "file"
+                    found_important.append(f"  ✓ {item} ({kind})")
+                else:
+                    other_count += 1
 
             # Print important packages first
             for item in found_important:
                 print(item)
 
-            # Then show a few other items
-            other_items = [
-                item
-                for item in items
-                if not any(imp.lower() in item.lower() for imp in important)
-            ]
-            print(f"  ... and {len(other_items)} other packages")
+            # Then count the rest
+            print(f"  ... and {other_count} other packages")
 
     else:
         print("Path already in sys.path")
@@ -144,15 +191,15 @@ from sys import exit, argv
 from PySide6.QtWidgets import QApplication
 from core.main_window import MainWindow
 
-
 if __name__ == "__main__":
     app = QApplication(argv)
     # Path relative to the project root (CWD)
     path_to_app_theme_css = path.join("ui//assets", "app-theme.css")
 
-    # Load the light theme stylesheet
-    with open(path_to_app_theme_css, "r") as f:
-        app.setStyleSheet(f.read())
+    # Load the light theme stylesheet: one raw read, decoded explicitly instead
+    # of through a locale-dependent text wrapper (ASCII takes the fast path)
+    with open(path_to_app_theme_css, "rb") as f:
+        app.setStyleSheet(f.read().decode("utf-8"))
 
     window = MainWindow()
     window.show()
@@ -1,8 +1,11 @@
 import psutil
 import time
 import statistics
-import subprocess
-import shutil
+
+try:
+    import pynvml
+except ImportError:  # nvidia-ml-py not installed: no GPU stats
+    pynvml = None
 
 SCRIPT_NAME = "main.py"
 SAMPLE_INTERVAL = 1
@@ -20,26 +23,27 @@ def find_pid_by_script(script_name: str):
     return None
 
 
-def get_nvidia_gpu_usage():
+def open_gpu():
+    """Open the first NVIDIA GPU through NVML, or return None if there is none."""
+    if pynvml is None:
+        return None
     try:
-        result = subprocess.check_output(
-            [
-                "nvidia-smi",
-                "--query-gpu=utilization.gpu,memory.used",
-                "--format=csv,noheader,nounits",
-            ],
-            encoding="utf-8",
-        ).strip()
-        usage, mem = map(int, result.split(","))
-        return usage, mem
-    except Exception:
-        return None, None
+        pynvml.nvmlInit()
+        return pynvml.nvmlDeviceGetHandleByIndex(0)
+    except pynvml.NVMLError:
+        return None
 
 
-def get_gpu_usage():
-    if shutil.which("nvidia-smi"):
-        return get_nvidia_gpu_usage()
-    else:
+def get_gpu_usage(gpu):
+    # NVML reads the driver's counters directly instead of starting nvidia-smi
+    # on every sample
+    if gpu is None:
+        return None, None
+    try:
+        usage = pynvml.nvmlDeviceGetUtilizationRates(gpu).gpu
+        mem = pynvml.nvmlDeviceGetMemoryInfo(gpu).used // 1024**2  # in MB
+        return usage, mem
+    except pynvml.NVMLError:
         return None, None
 
 
@@ -52,14 +56,25 @@ def monitor_process(pid: int):
     gpu_usages = []
     gpu_mem_usages = []
 
+    gpu = open_gpu()
+
     print(f"Monitoring process {pid}...")
 
     try:
-        while proc.is_running() and not proc.status() == psutil.STATUS_ZOMBIE:
-            cpu = proc.cpu_percent(interval=SAMPLE_INTERVAL)
-            mem = proc.memory_info().rss / 1024**2  # in MB
-
-            gpu_util, gpu_mem = get_gpu_usage()
+        # The first non-blocking cpu_percent() only sets the baseline
+        proc.cpu_percent(interval=None)
+        while True:
+            # Sleep outside oneshot(): inside it cpu_percent() would compare
+            # two reads of the same cached CPU times
+            time.sleep(SAMPLE_INTERVAL)
+            # One read of the process info for all of the values below
+            with proc.oneshot():
+                if not proc.is_running() or proc.status() == psutil.STATUS_ZOMBIE:
+                    break
+                cpu = proc.cpu_percent(interval=None)
+                mem = proc.memory_info().rss / 1024**2  # in MB
+
+            gpu_util, gpu_mem = get_gpu_usage(gpu)
 
             cpu_usages.append(cpu)
             mem_usages.append(mem)
@@ -75,6 +90,9 @@ def monitor_process(pid: int):
 
     except (psutil.NoSuchProcess, psutil.ZombieProcess):
         print("Process ended.")
+    finally:
+        if gpu is not None:
+            pynvml.nvmlShutdown()
 
     print("\n--- Final Stats ---")
 
@@ -1,21 +1,47 @@
-from requests import get, post, delete
+from concurrent.futures import ThreadPoolExecutor
+from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, ConnectionError, Timeout
 from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
 from utils.config import (
     API_BASE_URL,
     UPLOAD_TIMEOUT,
+    UPLOAD_PROGRESS_INTERVAL,
+    UPLOAD_CHUNK_SIZE,
     CANCEL_TIMEOUT,
     SERVER_HEALTH_CHECK_TIMEOUT,
-    SERVER_START_MAX_ATTEMPTS,
+    SERVER_START_TIMEOUT,
+    SERVER_START_POLL_INITIAL_DELAY,
+    SERVER_START_POLL_MAX_DELAY,
 )
-from time import sleep
+from time import monotonic, sleep
 from os import path
 from utils.logging_config import setup_logging
 
 
+class _ChunkedBody:
+    """Upload body that hands out UPLOAD_CHUNK_SIZE pieces per read.
+
+    http.client and urllib3 read request bodies 8-16 KiB at a time; every read
+    goes through the multipart encoder and the progress callback.
+    """
+
+    def __init__(self, body):
+        self.body = body
+        self.len = body.len  # Lets requests set Content-Length
+
+    def read(self, size=-1):
+        return self.body.read(size if size is None or size < 0 else UPLOAD_CHUNK_SIZE)
+
+
 class TranscriptionClient:
     """Handles HTTP communication with the transcription server."""
 
+    # Shared by every client so cancelling doesn't spin up threads each time
+    _shutdown_executor = ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix="transcription-shutdown"
+    )
+
     def __init__(self, server_port, transcription_server=None, context=None):
         self.logger = setup_logging()
         self.server_port = server_port
@@ -23,6 +49,9 @@ class TranscriptionClient:
         self.transcription_server = transcription_server
         self.context = context
         self.response = None
+        # One keep-alive session for every call to the local server
+        self.session = Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
     def start_server_if_needed(self):
         """Start the transcription server and verify it's ready."""
@@ -30,18 +59,23 @@ class TranscriptionClient:
             return
         self.logger.info("Starting transcription server on port %s", self.server_port)
         self.transcription_server.start()
-        for attempt in range(SERVER_START_MAX_ATTEMPTS):
+        # Poll with exponential backoff so readiness is noticed within a few
+        # tens of milliseconds instead of on the next whole-second tick.
+        delay = SERVER_START_POLL_INITIAL_DELAY
+        deadline = monotonic() + SERVER_START_TIMEOUT
+        while monotonic() < deadline:
             try:
-                response = get(
+                response = self.session.get(
                     f"{self.api_url}/health", timeout=SERVER_HEALTH_CHECK_TIMEOUT
                 )
                 if response.status_code == 200:
                     self.logger.info("Transcription server is ready")
                     return
             except RequestException:
-                sleep(1)
-            if attempt == SERVER_START_MAX_ATTEMPTS - 1:
-                raise RuntimeError("Transcription server failed to start")
+                pass
+            sleep(delay)
+            delay = min(delay * 1.7, SERVER_START_POLL_MAX_DELAY)
+        raise RuntimeError("Transcription server failed to start")
 
     def upload_video(
         self,
@@ -60,17 +94,27 @@ class TranscriptionClient:
                     }
                 )
 
+                last_emit = 0.0
+
                 def callback(monitor):
+                    nonlocal last_emit
                     if abort_check():
                         monitor.abort()
+                    # Called for every chunk read; report at most every
+                    # UPLOAD_PROGRESS_INTERVAL seconds, plus the final 100%.
+                    now = monotonic()
+                    done = monitor.bytes_read >= monitor.len
+                    if not done and now - last_emit < UPLOAD_PROGRESS_INTERVAL:
+                        return
+                    last_emit = now
                     percent = int((monitor.bytes_read / monitor.len) * 100)
-                    progress_callback(f"Uploading: {percent}%")
+                    progress_callback(percent, "upload")
 
                 monitor = MultipartEncoderMonitor(encoder, callback)
                 headers = {"Content-Type": monitor.content_type}
-                self.response = post(
+                self.response = self.session.post(
                     f"{self.api_url}/transcribe/",
-                    data=monitor,
+                    data=_ChunkedBody(monitor),
                     headers=headers,
                     stream=True,
                     timeout=UPLOAD_TIMEOUT,
@@ -92,7 +136,9 @@ class TranscriptionClient:
     def cancel_task(self, task_id):
         """Send cancellation request for a specific task."""
         try:
-            response = post(f"{self.api_url}/cancel/{task_id}", timeout=CANCEL_TIMEOUT)
+            response = self.session.post(
+                f"{self.api_url}/cancel/{task_id}", timeout=CANCEL_TIMEOUT
+            )
             if response.status_code == 200:
                 self.logger.info("Task %s cancellation initiated", task_id)
             else:
@@ -105,7 +151,7 @@ class TranscriptionClient:
     def cleanup_task(self, task_id):
         """Send cleanup request for a specific task."""
         try:
-            response = delete(
+            response = self.session.delete(
                 f"{self.api_url}/cleanup/{task_id}", timeout=CANCEL_TIMEOUT
             )
             if response.status_code == 200:
@@ -117,6 +163,18 @@ class TranscriptionClient:
         except Exception as e:
             self.logger.error("Error cleaning up task %s: %s", task_id, str(e))
 
+    def cancel_and_cleanup(self, task_id):
+        """Send the cancel and cleanup requests for a task concurrently."""
+        futures = [
+            self._shutdown_executor.submit(self.cancel_task, task_id),
+            self._shutdown_executor.submit(self.cleanup_task, task_id),
+        ]
+        for future in futures:
+            try:
+                future.result(timeout=CANCEL_TIMEOUT)
+            except Exception as e:
+                self.logger.error("Error shutting down task %s: %s", task_id, str(e))
+
     def close_response(self):
         """Close the active response object."""
         if self.response:
@@ -126,3 +184,8 @@ class TranscriptionClient:
             except Exception as e:
                 self.logger.error("Error closing response: %s", str(e))
             self.response = None
+
+    def close(self):
+        """Close the active response and the underlying HTTP session."""
+        self.close_response()
+        self.session.close()
@@ -1,18 +1,22 @@
 from os import path
 import os
 import re
+from queue import Empty, SimpleQueue
+from threading import Thread
 from PySide6.QtCore import QThread, Signal
-from json import loads, JSONDecodeError
-from filelock import FileLock
+from orjson import loads, JSONDecodeError
 from services.TranscriptionClient import TranscriptionClient
 from services.utils.context_manager import ContextManager
+from utils.config import WORKER_STOP_TIMEOUT
 from utils.logging_config import setup_logging
 
+STREAM_CHUNK_SIZE = 1 << 16  # bytes read per socket call while streaming results
+
 
 class TranscriptionWorkerAPI(QThread):
     finished = Signal(str)
     receive_first_segment = Signal(str)
-    progress = Signal(str)
+    progress = Signal(int, str)  # percent, phase ("upload")
     error = Signal(str)
 
     def __init__(self, transcription_server=None):
@@ -30,7 +34,8 @@ class TranscriptionWorkerAPI(QThread):
         )
         self.task_id = None
         self._is_running = True
-        self.lock = None
+        self._write_queue = None
+        self._writer_thread = None
         self.start_from = 0
         self.segment_counter = 0
 
@@ -38,6 +43,7 @@ class TranscriptionWorkerAPI(QThread):
         """Process transcription stream and save segments."""
         try:
             self._prepare_transcription_file()
+            self._start_writer()
             self.client.start_server_if_needed()
             self.task_id, response = self.client.upload_video(
                 self.context,
@@ -46,12 +52,14 @@ class TranscriptionWorkerAPI(QThread):
                 lambda: not self._is_running,
             )
             is_first_segment = True
-            for line in response.iter_lines():
+            for line in response.iter_lines(chunk_size=STREAM_CHUNK_SIZE):
                 if not self._is_running:
                     break
-                if line:
+                # Results arrive as server-sent events, one JSON result per data
+                # line; skip keep-alive pings and any other non-data field.
+                if line.startswith(b"data:"):
                     try:
-                        segment = loads(line)
+                        segment = loads(line[5:])
                         if "status" in segment:
                             self._handle_status(segment)
                             continue
@@ -150,27 +158,70 @@ class TranscriptionWorkerAPI(QThread):
         context.start_from = self.start_from
         context.segment_counter = self.segment_counter
 
-    def _save_segment(self, text):
-        """Save a transcription segment to file."""
+    def _start_writer(self):
+        """Start the thread that appends segments to the transcript file."""
         transcript_file = ContextManager.get_transcript_file()
-        self.lock = FileLock(ContextManager.get_transcript_file(is_lock=True))
-
-        with self.lock:
-            needs_newline = False
-
-            if os.path.exists(transcript_file) and os.path.getsize(transcript_file) > 0:
-                with open(transcript_file, "rb") as f:
-                    f.seek(-2, os.SEEK_END)
+        needs_newline = False
+        try:
+            with open(transcript_file, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size > 0:
+                    f.seek(max(0, size - 2))
                     last_bytes = f.read(2)
                     if not last_bytes.endswith(b"\n\n"):
                         needs_newline = True
+        except FileNotFoundError:
+            pass
+
+        self._write_queue = SimpleQueue()
+        self._writer_thread = Thread(
+            target=self._write_segments,
+            args=(transcript_file, self._write_queue, needs_newline),
+            daemon=True,
+        )
+        self._writer_thread.start()
+
+    def _write_segments(self, transcript_file, write_queue, needs_newline):
+        """Writer loop: keeps the transcript open and flushes after each burst.
+
+        This process is the only writer of the transcript, so segments are
+        serialized through the queue instead of a per-segment FileLock.
+        """
+        try:
+            with open(transcript_file, "a", encoding="utf-8", buffering=1 << 16) as f:
+                while True:
+                    text = write_queue.get()
+                    if text is None:
+                        break
+                    parts = []
+                    # Drain everything already queued and write it as one chunk
+                    while text is not None:
+                        if needs_newline:
+                            parts.append("\n")
+                        parts.append(text.rstrip() + "\n")
+                        needs_newline = True
+                        try:
+                            text = write_queue.get_nowait()
+                        except Empty:
+                            break
+                    f.write("".join(parts))
+                    f.flush()
+                    self.logger.debug("Saved SRT transcription segments: %s", parts)
+                    if text is None:
+                        break
+        except Exception as e:
+            self.logger.error("Error writing transcription file: %s", str(e))
 
-            with open(transcript_file, "a", encoding="utf-8") as f:
-                if needs_newline:
-                    f.write("\n")
-                f.write(text.rstrip() + "\n")
-                f.flush()
-            self.logger.debug("Saved SRT transcription segment: %s", text.strip())
+    def _save_segment(self, text):
+        """Queue a transcription segment to be saved to file."""
+        self._write_queue.put(text)
+
+    def _stop_writer(self):
+        """Flush pending segments and stop the writer thread."""
+        if self._writer_thread:
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
 
     def _handle_status(self, segment):
         """Handle status messages from the server."""
@@ -184,15 +235,16 @@ class TranscriptionWorkerAPI(QThread):
         self.logger.info("Stopping transcription worker")
         self._is_running = False
         if self.task_id:
-            self.client.cancel_task(self.task_id)
-            self.client.cleanup_task(self.task_id)
+            # The cleanup endpoint cancels the task too, so the two can overlap
+            self.client.cancel_and_cleanup(self.task_id)
         self.client.close_response()
-        self.wait(5000)
+        self.wait(WORKER_STOP_TIMEOUT)
         self.logger.info("Transcription worker stopped")
 
     def _cleanup(self):
         """Clean up resources after transcription."""
-        self.client.close_response()
+        self._stop_writer()
+        self.client.close()
         self.task_id = None
         if self.transcription_server and not getattr(
             self.transcription_server, "persistent", False
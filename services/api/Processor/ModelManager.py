@@ -1,5 +1,9 @@
+import threading
+from dataclasses import astuple, replace
+from typing import Iterable
+
 from services.utils.aspect import performance_log
-from services.models.model_config import ModelConfig
+from services.models.model_config import ModelConfig, default_config
 from services.models.model_loader import load_whisper_model
 from utils.logging_config import get_component_logger
 
@@ -7,17 +11,30 @@ logger = get_component_logger("video_processor")
 
 
 class ModelManager:
+    # Keeps loaded Whisper models resident for the lifetime of the process
     def __init__(self):
-        self.whisper_model = None
-        self.current_config = None
+        self.model_cache = {}  # astuple(config) -> WhisperModel
+        self.model_cache_lock = threading.Lock()
 
     @performance_log
     def get_model(self, config: ModelConfig):
-        if self.whisper_model is None or self.current_config != config:
-            logger.info(f"Loading transcription model with config: {config}")
-            self.whisper_model = load_whisper_model(config)
-            self.current_config = config
-            logger.info("Transcription model loaded successfully")
-        else:
+        key = astuple(config)
+        model = self.model_cache.get(key)
+        if model is not None:
             logger.debug("Using cached transcription model")
-        return self.whisper_model
+            return model
+
+        with self.model_cache_lock:
+            # Another request may have loaded it while we were waiting
+            model = self.model_cache.get(key)
+            if model is None:
+                logger.info(f"Loading transcription model with config: {config}")
+                model = load_whisper_model(config)
+                self.model_cache[key] = model
+                logger.info("Transcription model loaded successfully")
+        return model
+
+    def preload(self, model_names: Iterable[str]) -> None:
+        """Load the given Whisper models up front so the first request doesn't pay for it."""
+        for model_name in model_names:
+            self.get_model(replace(default_config, whisper_model_name=model_name))
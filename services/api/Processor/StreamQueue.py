@@ -0,0 +1,117 @@
+from asyncio import (
+    AbstractEventLoop,
+    Queue,
+    QueueFull,
+    ensure_future,
+    run_coroutine_threadsafe,
+    wait,
+)
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from queue import Full
+from threading import Event
+from typing import Any, Optional
+
+from orjson import dumps
+
+from services.api.constants import STOP_SIGNAL
+from utils.logging_config import get_component_logger
+
+logger = get_component_logger("video_processor")
+
+PUT_RETRY_INTERVAL = 0.5  # seconds a blocked put waits before re-checking the task
+
+
+class StreamQueue:
+    """asyncio.Queue that worker threads can feed and the streaming response can await.
+
+    Producers run in plain threads, so every put is handed over to the event loop
+    the queue belongs to. The consumer awaits get() and wakes up as soon as an item
+    is available instead of polling.
+
+    Results are serialized on the producer side: get() returns STOP_SIGNAL or a
+    (json_payload, is_final) tuple, where is_final marks error/cancelled statuses.
+
+    A blocked put gives up once the task is cancelled or the loop stops, since
+    nothing will drain the queue after the client stream has gone away.
+    """
+
+    def __init__(self, loop: AbstractEventLoop, cancel_event: Event, maxsize: int = 0):
+        self.loop = loop
+        self.cancel_event = cancel_event
+        self._queue = Queue(maxsize=maxsize)
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """Blocking put from a worker thread; waits while the queue is full.
+
+        Without a timeout the item is dropped once the task is cancelled. With
+        one, the put keeps trying for that long even after cancellation, which
+        lets STOP_SIGNAL still reach a client that is draining the queue.
+        Returns False if the item was dropped.
+        """
+        if not self.loop.is_running():
+            logger.debug("Dropped stream item: event loop stopped.")
+            return False
+        # Submitted once: only the loop decides whether the item went in, so a
+        # slow loop can never end up with the same result queued twice
+        future = run_coroutine_threadsafe(
+            self._put_on_loop_until(self._encode(item), timeout), self.loop
+        )
+        while True:
+            try:
+                return future.result(PUT_RETRY_INTERVAL)
+            except FutureTimeoutError:
+                if not self.loop.is_running():
+                    future.cancel()
+                    logger.debug("Dropped stream item: event loop stopped.")
+                    return False
+
+    async def _put_on_loop_until(self, payload: Any, timeout: Optional[float]) -> bool:
+        put_task = ensure_future(self._queue.put(payload))
+        deadline = None if timeout is None else self.loop.time() + timeout
+        while True:
+            if deadline is None:
+                if self.cancel_event.is_set():
+                    break
+                wait_time = PUT_RETRY_INTERVAL
+            else:
+                wait_time = min(PUT_RETRY_INTERVAL, deadline - self.loop.time())
+                if wait_time <= 0:
+                    break
+            # wait() leaves the put pending on timeout instead of cancelling it
+            done, _ = await wait({put_task}, timeout=wait_time)
+            if done:
+                return True
+        # Still pending here on the loop thread, so cancelling it means the
+        # item was never enqueued
+        put_task.cancel()
+        logger.debug("Dropped stream item: task cancelled or put timed out.")
+        return False
+
+    def put_nowait(self, item: Any) -> None:
+        """Non-blocking put from any thread. Raises queue.Full if the queue is full."""
+        if self._queue.full():
+            raise Full
+        self.loop.call_soon_threadsafe(self._put_on_loop, self._encode(item))
+
+    @staticmethod
+    def _encode(item: Any) -> Any:
+        if item is STOP_SIGNAL:
+            return item
+        is_final = isinstance(item, dict) and item.get("status") in [
+            "error",
+            "cancelled",
+        ]
+        return dumps(item).decode(), is_final
+
+    def _put_on_loop(self, item: Any) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except QueueFull:
+            logger.warning("Stream queue filled up before item could be enqueued.")
+
+    async def get(self) -> Any:
+        return await self._queue.get()
+
+    def get_nowait(self) -> Any:
+        """Raises asyncio.QueueEmpty if nothing is queued. Event loop thread only."""
+        return self._queue.get_nowait()
@@ -1,12 +1,14 @@
 from services.api.constants import STOP_SIGNAL
+from services.api.Processor.StreamQueue import StreamQueue
 from utils.logging_config import get_component_logger
 
 
 import threading
-from queue import Full as QueueFull, Queue
+from asyncio import AbstractEventLoop
+from queue import Full as QueueFull
 from typing import Tuple
 
-DEFAULT_OUTPUT_QUEUE_SIZE = 100  # Final client output queue size (used by TaskManager)
+DEFAULT_OUTPUT_QUEUE_SIZE = 256  # Final client output queue size (used by TaskManager)
 logger = get_component_logger("video_processor")
 
 
@@ -17,19 +19,52 @@ class TaskManager:
         self.cancel_events = {}
         self.cancel_events_lock = threading.Lock()
 
-    def register_task(self, task_id: str) -> Tuple[Queue, threading.Event]:
+    def register_task(
+        self, task_id: str, loop: AbstractEventLoop
+    ) -> Tuple[StreamQueue, threading.Event]:
+        # `loop` is the event loop that streams the results; every put from the
+        # worker threads is handed over to it.
+        if loop is None:
+            raise ValueError(f"Task {task_id} needs an event loop to stream to.")
         with self.cancel_events_lock:
             if task_id not in self.cancel_events:
                 self.cancel_events[task_id] = threading.Event()
             if task_id not in self.segment_queues:
-                self.segment_queues[task_id] = Queue(maxsize=DEFAULT_OUTPUT_QUEUE_SIZE)
+                self.segment_queues[task_id] = StreamQueue(
+                    loop,
+                    self.cancel_events[task_id],
+                    maxsize=DEFAULT_OUTPUT_QUEUE_SIZE,
+                )
         return self.segment_queues[task_id], self.cancel_events[task_id]
 
+    def get_task(self, task_id: str) -> Tuple[StreamQueue, threading.Event]:
+        # Looks up a task registered by the streaming route; raises KeyError if
+        # there is none, since only the route knows which loop to stream to.
+        with self.cancel_events_lock:
+            return self.segment_queues[task_id], self.cancel_events[task_id]
+
     def cancel_task(self, task_id: str) -> None:
         with self.cancel_events_lock:
             if task_id in self.cancel_events:
+                if self.cancel_events[task_id].is_set():
+                    return
                 self.cancel_events[task_id].set()
                 logger.info(f"Task {task_id} cancellation requested")
+                # Wake up the client stream so it can report the cancellation
+                if task_id in self.segment_queues:
+                    try:
+                        self.segment_queues[task_id].put_nowait(
+                            {
+                                "status": "cancelled",
+                                "message": "Task cancelled by server",
+                            }
+                        )
+                    except QueueFull:
+                        logger.warning(
+                            f"Output queue for task {task_id} was full during cancel_task."
+                        )
+                    except Exception:
+                        pass
 
     def is_cancelled(self, task_id: str) -> bool:
         return self.cancel_events.get(task_id, threading.Event()).is_set()
@@ -1,14 +1,14 @@
-from os import path
 from shutil import rmtree
 from threading import Thread, Event
 from numpy import ndarray
-from queue import Empty, Queue, Full as QueueFull
-from typing import Optional, Any
+from queue import Empty, SimpleQueue, Full as QueueFull
+from typing import Optional, Any, Union
 
 from services.api.Processor.AudioPreprocessor import AudioPreprocessor
 from services.api.Processor.TaskManager import TaskManager
 from services.api.Processor.ModelManager import ModelManager
-from services.api.constants import STOP_SIGNAL
+from services.api.Processor.StreamQueue import StreamQueue
+from services.api.constants import STOP_SIGNAL, STOP_SIGNAL_TIMEOUT
 from services.config.context import ProcessingContext
 from services.models.model_config import default_config
 from services.utils.aspect import performance_log
@@ -18,7 +18,7 @@ from utils.logging_config import get_component_logger
 
 logger = get_component_logger("video_processor")
 
-DEFAULT_TRANSCRIPTION_QUEUE_SIZE = 50
+DEFAULT_TRANSLATION_BATCH_SIZE = 8
 
 
 class VideoProcessor:
@@ -33,7 +33,7 @@ class VideoProcessor:
         raw_audio_np: ndarray,
         sample_rate: int,
         whisper_model: Any,
-        target_queue: Queue,
+        target_queue: Union[SimpleQueue, StreamQueue],
         context: ProcessingContext,
         cancel_event: Event,
     ):
@@ -113,7 +113,7 @@ class VideoProcessor:
             )
 
         finally:
-            target_queue.put(STOP_SIGNAL)
+            target_queue.put(STOP_SIGNAL, timeout=STOP_SIGNAL_TIMEOUT)
             logger.info(
                 f"Task {context.task_id} (Transcription): Producer finished, sent STOP_SIGNAL to target queue."
             )
@@ -121,8 +121,8 @@ class VideoProcessor:
     def _translation_consumer_producer_worker(
         self,
         translator_instance: Translator,
-        input_queue: Queue,  # Consumes from transcription_queue
-        output_queue: Queue,  # Produces to client_output_queue
+        input_queue: SimpleQueue,  # Consumes from transcription_queue
+        output_queue: StreamQueue,  # Produces to client_output_queue
         task_id: str,
         cancel_event: Event,
     ):
@@ -132,39 +132,47 @@ class VideoProcessor:
                     logger.info(f"Task {task_id} (Translation): Cancellation detected.")
                     break
                 try:
-                    segment_to_translate = input_queue.get(timeout=0.5)
+                    batch = [input_queue.get(timeout=0.5)]
                 except Empty:
                     continue
 
-                if segment_to_translate is STOP_SIGNAL:
+                # Drain whatever else is already waiting so the model translates
+                # a burst of segments in one generate call.
+                while len(batch) < DEFAULT_TRANSLATION_BATCH_SIZE and not (
+                    self._is_control_item(batch[-1])
+                ):
+                    try:
+                        batch.append(input_queue.get_nowait())
+                    except Empty:
+                        break
+
+                control_item = batch.pop() if self._is_control_item(batch[-1]) else None
+
+                # each item is {"text": "...", "start": S, "end": E, "index": I}
+                # The Translator.translate_batch expects a list of these dicts
+                if batch:
+                    for translated_segment_data in translator_instance.translate_batch(
+                        batch
+                    ):
+                        output_queue.put(translated_segment_data)
+                        logger.debug(
+                            f"Task {task_id} (Translation): Produced translated segment {translated_segment_data.get('index', 'N/A')}"
+                        )
+
+                if control_item is STOP_SIGNAL:
                     logger.info(
                         f"Task {task_id} (Translation): Received STOP_SIGNAL from transcription."
                     )
                     break
 
-                if (
-                    isinstance(segment_to_translate, dict)
-                    and segment_to_translate.get("status") == "error"
-                ):
+                if control_item is not None:
                     logger.warning(
                         f"Task {task_id} (Translation): Received error signal from transcription. Propagating."
                     )
-                    output_queue.put(segment_to_translate)  # Propagate error
-                    # continue or break? If transcription failed, probably break.
+                    output_queue.put(control_item)  # Propagate error
+                    # If transcription failed, stop translating.
                     break
 
-                # segment_to_translate is {"text": "...", "start": S, "end": E, "index": I}
-                # The Translator.translate_segment expects this dict structure
-                translated_segment_data = translator_instance.translate_segment(
-                    segment_to_translate
-                )
-
-                output_queue.put(translated_segment_data)
-                logger.debug(
-                    f"Task {task_id} (Translation): Produced translated segment {translated_segment_data.get('index', 'N/A')}"
-                )
-                input_queue.task_done()
-
         except Exception as e:
             logger.error(
                 f"Task {task_id} (Translation): Error during translation: {e}",
@@ -174,11 +182,19 @@ class VideoProcessor:
                 {"status": "error", "message": "Translation process failed."}
             )
         finally:
-            output_queue.put(STOP_SIGNAL)  # Ensure client queue gets stop signal
+            # Ensure client queue gets stop signal
+            output_queue.put(STOP_SIGNAL, timeout=STOP_SIGNAL_TIMEOUT)
             logger.info(
                 f"Task {task_id} (Translation): Consumer-Producer finished, sent STOP_SIGNAL to client output queue."
             )
 
+    @staticmethod
+    def _is_control_item(item: Any) -> bool:
+        """True for the items that end a translation batch: STOP_SIGNAL or an error dict."""
+        return item is STOP_SIGNAL or (
+            isinstance(item, dict) and item.get("status") == "error"
+        )
+
     @performance_log
     def process_video_with_streaming(
         self,
@@ -187,12 +203,11 @@ class VideoProcessor:
         translator: Translator,
     ):
         task_id = context.task_id
-        client_output_queue, cancel_event = self.task_manager.register_task(task_id)
-
         transcription_thread = None
         translator_thread = None
 
         try:
+            client_output_queue, cancel_event = self.task_manager.get_task(task_id)
             self.audio_processor.load_raw_audio_into_context(context, cancel_event)
 
             if cancel_event.is_set():
@@ -211,9 +226,9 @@ class VideoProcessor:
 
             whisper_model = self.model_manager.get_model(default_config)
 
-            transcription_to_translation_queue = Queue(
-                maxsize=DEFAULT_TRANSCRIPTION_QUEUE_SIZE
-            )
+            # Single producer / single consumer hand-off: SimpleQueue is C-implemented
+            # and skips the task_done bookkeeping of queue.Queue.
+            transcription_to_translation_queue = SimpleQueue()
 
             transcription_thread = Thread(
                 target=self._transcription_producer_worker,
@@ -354,12 +369,11 @@ class VideoProcessor:
 
     @staticmethod
     def _cleanup_output_folder(output_folder: str) -> None:
-        # [Code from your existing VideoProcessor.py - unchanged]
-        if path.exists(output_folder):
-            try:
-                rmtree(output_folder)
-                logger.info(f"Successfully removed output folder: {output_folder}")
-            except Exception as e:
-                logger.error(f"Error removing output folder {output_folder}: {e}")
-        else:
+        # Just try to remove it; a separate exists() check costs an extra stat
+        try:
+            rmtree(output_folder)
+            logger.info(f"Successfully removed output folder: {output_folder}")
+        except FileNotFoundError:
             logger.info(f"Output folder not found, no need to remove: {output_folder}")
+        except Exception as e:
+            logger.error(f"Error removing output folder {output_folder}: {e}")
@@ -1 +1,2 @@
 STOP_SIGNAL = object()
+STOP_SIGNAL_TIMEOUT = 5  # seconds a producer waits to enqueue STOP_SIGNAL
@@ -1,13 +1,15 @@
-from asyncio import sleep
-from json import dumps
-from os import makedirs, path
-from shutil import rmtree, copyfileobj
+from asyncio import QueueEmpty, get_running_loop, sleep
+from os import makedirs
+from shutil import rmtree
 from threading import Thread
+from typing import List
 from uuid import uuid4
-from queue import Empty as QueueEmpty
 
+from aiofiles import open as aio_open
 from fastapi import FastAPI, UploadFile, File, Form
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import JSONResponse
+from orjson import dumps
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 
 from services.api.constants import STOP_SIGNAL
 from services.api.VideoProcessor import VideoProcessor
@@ -20,8 +22,16 @@ from utils.logging_config import get_component_logger
 
 logger = get_component_logger("video_processor")
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB reads when saving uploaded videos
+MAX_RESULTS_PER_EVENT = 32  # Queued results coalesced into one streamed event
 
-def setup_routes(app: FastAPI, processor: VideoProcessor, translator: Translator):
+
+def setup_routes(
+    app: FastAPI,
+    processor: VideoProcessor,
+    translator: Translator,
+    preload_models: List[str],
+):
     @app.get("/health")
     async def health_check():
         return JSONResponse(content={"status": "ok"}, status_code=200)
@@ -37,10 +47,13 @@ def setup_routes(app: FastAPI, processor: VideoProcessor, translator: Translator
         makedirs(output_folder, exist_ok=True)
         temp_file_path = f"{output_folder}/input_video.mp4"
 
-        with open(temp_file_path, "wb") as buffer:
-            copyfileobj(file.file, buffer)
+        async with aio_open(temp_file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
 
-        client_output_queue, _ = processor.task_manager.register_task(task_id)
+        client_output_queue, _ = processor.task_manager.register_task(
+            task_id, get_running_loop()
+        )
 
         context = ContextManager.get_context()
         context.task_id = task_id
@@ -62,57 +75,61 @@ def setup_routes(app: FastAPI, processor: VideoProcessor, translator: Translator
         ).start()
 
         async def stream_transcription_results():
-            # It reads from client_output_queue and sends JSON lines.
+            # It awaits client_output_queue and sends each pre-serialized result
+            # as an SSE event carrying a JSON payload.
             # Ensure it handles STOP_SIGNAL and potential error dicts correctly.
             try:
                 while True:
-                    if processor.task_manager.is_cancelled(task_id):
-                        logger.info(
-                            f"Task {task_id} cancelled by server. Stopping client stream."
-                        )
-                        yield dumps(
-                            {
-                                "status": "cancelled",
-                                "message": "Task cancelled by server",
-                            }
-                        ) + "\n"
-                        break
                     try:
-                        result = client_output_queue.get(
-                            timeout=0.1
-                        )  # Timeout to check cancellation
+                        # Wait for one result, then take whatever else is already
+                        # queued so a burst goes out in a single event / write.
+                        results = [await client_output_queue.get()]
+                        while (
+                            len(results) < MAX_RESULTS_PER_EVENT
+                            and results[-1] is not STOP_SIGNAL
+                            and not results[-1][1]
+                        ):
+                            try:
+                                results.append(client_output_queue.get_nowait())
+                            except QueueEmpty:
+                                break
+
+                        stop_received = results[-1] is STOP_SIGNAL
+                        if stop_received:
+                            results.pop()
+
+                        # Results arrive already serialized by the producer thread
+                        # as (payload, is_final); each payload becomes one data line.
+                        if results:
+                            yield ServerSentEvent(
+                                data="\n".join(payload for payload, _ in results)
+                            )
 
-                        if result is STOP_SIGNAL:
+                        if stop_received:
                             logger.info(
                                 f"Task {task_id} (ClientStream): Received STOP_SIGNAL. Ending stream."
                             )
                             break
 
-                        yield dumps(result) + "\n"
-                        if isinstance(result, dict) and result.get("status") in [
-                            "error",
-                            "cancelled",
-                        ]:
+                        if results and results[-1][1]:
                             logger.info(
-                                f"Task {task_id} (ClientStream): Stream ending due to status: {result['status']}"
+                                f"Task {task_id} (ClientStream): Stream ending due to error/cancelled status."
                             )
                             break
-
-                        await sleep(0)  # Yield control for other async tasks in FastAPI
-                    except QueueEmpty:
-                        await sleep(0.1)
                     except Exception as e:
                         logger.error(
                             f"Error streaming transcription results for task {task_id}: {e}",
                             exc_info=True,
                         )
                         try:
-                            yield dumps(
-                                {
-                                    "status": "error",
-                                    "message": "Streaming error occurred on server",
-                                }
-                            ) + "\n"
+                            yield ServerSentEvent(
+                                data=dumps(
+                                    {
+                                        "status": "error",
+                                        "message": "Streaming error occurred on server",
+                                    }
+                                ).decode()
+                            )
                         except Exception as send_err:
                             logger.error(
                                 f"Failed to send streaming error to client for task {task_id}: {send_err}"
@@ -129,9 +146,8 @@ def setup_routes(app: FastAPI, processor: VideoProcessor, translator: Translator
                     )
                     processor.task_manager.cancel_task(task_id)
 
-        return StreamingResponse(
+        return EventSourceResponse(
             stream_transcription_results(),
-            media_type="application/json",
             headers={"task_id": task_id},
         )
 
@@ -159,16 +175,17 @@ def setup_routes(app: FastAPI, processor: VideoProcessor, translator: Translator
 
             # Forcibly clean output folder if it still exists (VideoProcessor might have cleaned it)
             output_folder = f"temp/{task_id}"
-            if path.exists(output_folder):
-                try:
-                    rmtree(output_folder)
-                    logger.info(
-                        f"Removed output folder {output_folder} for task {task_id} via cleanup endpoint."
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Error removing output folder {output_folder} in cleanup endpoint: {e}"
-                    )
+            try:
+                rmtree(output_folder)
+                logger.info(
+                    f"Removed output folder {output_folder} for task {task_id} via cleanup endpoint."
+                )
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(
+                    f"Error removing output folder {output_folder} in cleanup endpoint: {e}"
+                )
 
             # Call task_manager.cleanup_task again as a final measure,
             # though VideoProcessor should have called it.
@@ -186,3 +203,6 @@ def setup_routes(app: FastAPI, processor: VideoProcessor, translator: Translator
         logger.info("Loading translation model on startup...")
         translator.nmt_model, translator.tokenizer = load_translation_model()
         logger.info("Translation model loaded.")
+        logger.info(f"Preloading transcription models on startup: {preload_models}")
+        processor.model_manager.preload(preload_models)
+        logger.info("Transcription models loaded.")
@@ -1,14 +1,13 @@
 from threading import Thread
 from os import path, makedirs
+from typing import List, Optional
 from atexit import register
 from shutil import rmtree
 from uvicorn import Config, Server
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from services.api.VideoProcessor import VideoProcessor
-from services.api.routes import setup_routes
-from services.transcription.translator import Translator
+from services.models.model_config import default_config
 from services.utils.network import is_port_available
 from utils.logging_config import get_component_logger
 
@@ -18,18 +17,31 @@ logger = get_component_logger("video_processor")
 class TranscriptionServer:
     """FastAPI server for streaming video transcription and translation."""
 
-    def __init__(self, host: str = "0.0.0.0", port: int = 8000):
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        preload_models: Optional[List[str]] = None,
+    ):
         """Initialize the transcription server.
 
         Args:
             host: Host address to bind the server to
             port: Port to listen on
+            preload_models: Whisper model names to load on startup and keep resident.
+                Defaults to the model in default_config.
         """
         self.host = host
         self.port = port
+        self.preload_models = (
+            preload_models
+            if preload_models is not None
+            else [default_config.whisper_model_name]
+        )
         self.app = FastAPI(title="Video Transcription Streaming API")
-        self.processor = VideoProcessor()
-        self.translator = Translator()
+        # Created by setup_pipeline() when the server first starts
+        self.processor = None
+        self.translator = None
         self.server_thread = None
         self.uvicorn_server = (
             None  # To manage the uvicorn server instance for graceful shutdown
@@ -37,7 +49,6 @@ class TranscriptionServer:
 
         # Set up the application
         self.setup_middleware()
-        setup_routes(self.app, self.processor, self.translator)
 
         # Register cleanup handler
         register(self.cleanup)
@@ -55,9 +66,25 @@ class TranscriptionServer:
         )  #
         logger.debug("CORS middleware configured")
 
+    def setup_pipeline(self):
+        """Create the processing pipeline and its routes."""
+        # Imported here rather than at the top: these pull in torch,
+        # transformers and faster_whisper, which would otherwise load with the
+        # main window instead of with the first transcription
+        from services.api.VideoProcessor import VideoProcessor
+        from services.api.routes import setup_routes
+        from services.transcription.translator import Translator
+
+        self.processor = VideoProcessor()
+        self.translator = Translator()
+        setup_routes(self.app, self.processor, self.translator, self.preload_models)
+        logger.debug("Processing pipeline and routes configured")
+
     def start(self):  #
         """Start the FastAPI server."""
         if not self.server_thread or not self.server_thread.is_alive():
+            if self.processor is None:
+                self.setup_pipeline()
             while not is_port_available(self.port):
                 logger.warning(f"Port {self.port} in use, trying next...")
                 self.port += 1
@@ -102,6 +129,9 @@ class TranscriptionServer:
 
     def _cancel_all_tasks(self):
         """Cancel all active transcription tasks."""
+        if self.processor is None:
+            logger.info("Server never started, no tasks to cancel.")
+            return
         with self.processor.task_manager.cancel_events_lock:
             task_ids = list(self.processor.task_manager.cancel_events.keys())
 
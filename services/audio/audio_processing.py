@@ -74,7 +74,7 @@ def extract_raw_audio_to_numpy(
         video_path,
         "-vn",  # No video
         "-acodec",
-        "pcm_s16le",  # Output PCM 16-bit little-endian
+        "pcm_f32le",  # Output PCM 32-bit float little-endian
         "-ar",
         "16000",  # Target sample rate 16kHz (Whisper preferred)
         "-ac",
@@ -82,7 +82,7 @@ def extract_raw_audio_to_numpy(
         "-af",
         "aresample=resampler=soxr",  # Use SoXR resampler (faster than default)
         "-f",
-        "s16le",  # Output raw s16le PCM
+        "f32le",  # Output raw f32le PCM, already in Whisper's [-1.0, 1.0] range
         "pipe:1",  # Output to stdout
     ]
     try:
@@ -95,11 +95,9 @@ def extract_raw_audio_to_numpy(
             )
             return None, None
 
-        # Convert raw PCM data to NumPy array
-        # s16le means signed 16-bit little-endian integers
-        audio_data_int16 = np.frombuffer(stdout, dtype=np.int16)
-        # Normalize to float32 range [-1.0, 1.0]
-        audio_data_float32 = audio_data_int16.astype(np.float32) / 32768.0
+        # View the raw PCM bytes as a NumPy array without copying
+        # f32le means 32-bit float little-endian samples
+        audio_data_float32 = np.frombuffer(stdout, dtype="<f4")
         sample_rate = 16000  # We requested this sample rate from ffmpeg
 
         logger.info(
@@ -19,11 +19,7 @@ class ProcessingContext:
         self.video_metadata: dict = get_video_metadata(self.video_path)
         self.video_hash: str = None
 
-        # Original path attributes
-        self.raw_audio_path: str = f"{self.output_folder}/raw_audio.wav"
-        self.cleaned_audio_path: str = f"{self.output_folder}/cleaned_audio.wav"
-
-        # New attributes for in-memory audio processing
+        # In-memory audio, decoded straight from the ffmpeg pipe
         self.audio_data_np: Optional[ndarray] = None
         self.sample_rate: Optional[int] = None
 
@@ -11,10 +11,14 @@ class ModelConfig:
 
     # MarianMT model settings
     marianmt_model_name: str = "marian_en_ar_distilled_f16"
+    # torch intra-op threads for translation on CPU. If None, the cores left over
+    # after Whisper's cpu_threads, since transcription runs at the same time.
+    marianmt_cpu_threads: Optional[int] = None
 
     # Whisper model settings
     whisper_model_name: str = "small"
-    whisper_compute_type: str = "int8"
+    whisper_compute_type: str = "int8"  # Used on CPU
+    whisper_gpu_compute_type: str = "int8_float16"  # Used on CUDA
     whisper_cpu_threads: int = 2
     whisper_num_workers: int = 2
 
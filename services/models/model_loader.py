@@ -1,5 +1,5 @@
-from os import path
-from torch import cuda, float16
+from os import cpu_count, path
+from torch import cuda, float16, set_num_threads
 from faster_whisper import WhisperModel
 from transformers import MarianMTModel, MarianTokenizer
 from services.models.model_config import ModelConfig, default_config
@@ -33,6 +33,14 @@ def load_translation_model(config: ModelConfig = default_config):
 
         device = config.device or ("cuda" if cuda.is_available() else "cpu")
         logger.info(f"Using device: {device}")
+        if device == "cpu":
+            # torch defaults to one thread per core, which oversubscribes the CPU
+            # while Whisper is transcribing in parallel.
+            num_threads = config.marianmt_cpu_threads or max(
+                1, (cpu_count() or 1) - config.whisper_cpu_threads
+            )
+            set_num_threads(num_threads)
+            logger.info(f"Using {num_threads} CPU threads for translation")
         nmt_model = nmt_model.to(device)
         nmt_model.eval()
 
@@ -63,9 +71,14 @@ def load_whisper_model(config: ModelConfig = default_config) -> WhisperModel:
 
     try:
         device = config.device or ("cuda" if cuda.is_available() else "cpu")
+        compute_type = (
+            config.whisper_gpu_compute_type
+            if device == "cuda"
+            else config.whisper_compute_type
+        )
         logger.info(f"Using device: {device}")
         logger.debug(
-            f"Model configuration: compute_type={config.whisper_compute_type}, "
+            f"Model configuration: compute_type={compute_type}, "
             f"cpu_threads={config.whisper_cpu_threads}, "
             f"num_workers={config.whisper_num_workers}"
         )
@@ -73,7 +86,7 @@ def load_whisper_model(config: ModelConfig = default_config) -> WhisperModel:
         model = WhisperModel(
             model_path,
             device=device,
-            compute_type=config.whisper_compute_type,
+            compute_type=compute_type,
             cpu_threads=config.whisper_cpu_threads,
             num_workers=config.whisper_num_workers,
         )
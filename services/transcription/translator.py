@@ -1,4 +1,4 @@
-from typing import Dict  # Changed from List, Dict
+from typing import Dict, List
 from torch import no_grad, amp
 from contextlib import nullcontext
 
@@ -21,23 +21,37 @@ class Translator:
         self.nmt_model = None
         self.tokenizer = None
 
-    @performance_log
     def translate_segment(self, segment_data: Dict) -> Dict:
         """
         Translates the text within the provided segment dictionary.
         Expects segment_data: {"text": "...", "start": S, "end": E, "index": I}
         Returns the same dict with "text" translated.
         """
-        original_text = segment_data.get("text", "")
-        if not original_text:
-            logger.warning(
-                f"Segment {segment_data.get('index', 'N/A')} has no text to translate."
-            )
-            return segment_data  # Return original if no text
+        return self.translate_batch([segment_data])[0]
+
+    @performance_log
+    def translate_batch(self, segments: List[Dict]) -> List[Dict]:
+        """
+        Translates several segments with a single tokenizer + generate call.
+        Each item is a segment dict as accepted by translate_segment; results are
+        returned in the same order with "text" translated.
+        """
+        results = list(segments)
+        pending = []  # positions of segments that actually have text
+        for position, segment_data in enumerate(segments):
+            if segment_data.get("text", ""):
+                pending.append(position)
+            else:
+                logger.warning(
+                    f"Segment {segment_data.get('index', 'N/A')} has no text to translate."
+                )
+        if not pending:
+            return results  # Return originals if no text
 
+        original_texts = [segments[position]["text"] for position in pending]
         try:
             inputs = self.tokenizer(
-                original_text,
+                original_texts,
                 return_tensors="pt",
                 padding=True,
                 truncation=True,
@@ -50,21 +64,25 @@ class Translator:
                         **inputs, num_beams=1, max_length=512
                     )
 
-            translated_text = self.tokenizer.decode(
-                translated_ids[0], skip_special_tokens=True
+            translated_texts = self.tokenizer.batch_decode(
+                translated_ids, skip_special_tokens=True
             )
 
-            return {
-                **segment_data,  # Copies all original fields like start, end, index
-                "text": translated_text,
-            }
+            # Copies all original fields like start, end, index
+            for position, translated_text in zip(pending, translated_texts):
+                results[position] = {
+                    **segments[position],
+                    "text": translated_text,
+                }
         except Exception as e:
             logger.error(
-                f"Translation error for segment {segment_data.get('index', 'N/A')}, text '{original_text[:50]}...': {e}",
+                f"Translation error for segments {[segments[p].get('index', 'N/A') for p in pending]}: {e}",
                 exc_info=True,
             )
-            # Return original segment data with an error marker in text or a new field
-            return {
-                **segment_data,
-                "text": f"[Translation Error] {original_text}",
-            }
+            # Return original segment data with an error marker in text
+            for position in pending:
+                results[position] = {
+                    **segments[position],
+                    "text": f"[Translation Error] {segments[position]['text']}",
+                }
+        return results
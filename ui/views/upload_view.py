@@ -49,8 +49,10 @@ class Upload(QWidget):
         path_to_animation_html = path.join("ui//assets", "animationLoader.html")
         self.file_html = path_to_animation_html
 
+        # Static file: read it once and reuse it on every reset_scene
         with open(self.file_html, "r", encoding="utf-8") as file:
-            self.webview.setHtml(file.read())
+            self.animation_html = file.read()
+        self.webview.setHtml(self.animation_html)
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setMinimum(0)
@@ -78,7 +80,8 @@ class Upload(QWidget):
             return
 
         self.transcription_worker = TranscriptionWorkerAPI(self.transcription_server)
-        self.main_window.video_player.transcription_worker = self.transcription_worker
+        video_player = self.main_window.ensure_video_player()
+        video_player.transcription_worker = self.transcription_worker
         self.transcription_worker.progress.connect(self.update_progress)
 
         if self.check_cached_transcription():
@@ -89,7 +92,7 @@ class Upload(QWidget):
             )
 
         self.transcription_worker.finished.connect(
-            self.main_window.video_player.subtitle_manager.set_transcription_complete
+            video_player.subtitle_manager.set_transcription_complete
         )
         self.transcription_worker.error.connect(self.handle_error)
         self.transcription_worker.start()
@@ -134,11 +137,10 @@ class Upload(QWidget):
         msg_box.setStandardButtons(QMessageBox.Ok)
         msg_box.exec()
 
-    def update_progress(self, message):
+    def update_progress(self, percent, phase):
         """Update progress bar based on transcription progress."""
-        self.logger.debug("Progress update: %s", message)
-        if message.startswith("Uploading:"):
-            percent = int(message.split(":")[1].replace("%", "").strip())
+        self.logger.debug("Progress update: %s %d%%", phase, percent)
+        if phase == "upload":
             if percent < 4:
                 self.progress_bar.setValue(0)
             else:
@@ -153,6 +155,4 @@ class Upload(QWidget):
         """Reset the upload scene to initial state."""
         self.upload_label.setText("Uploading video, please wait...")
         self.progress_bar.setValue(0)
-
-        with open(self.file_html, "r", encoding="utf-8") as file:
-            self.webview.setHtml(file.read())
+        self.webview.setHtml(self.animation_html)
@@ -77,7 +77,8 @@ class VideoPlayerUI(QMainWindow):
         shadow.setColor(QColor(0, 0, 0, 160))
         self.subtitle_text.setGraphicsEffect(shadow)
 
-        # Center-justify the text within its box
+        # Center-justify the text within its box; the document keeps this
+        # option across setPlainText(), so it only has to be set once
         doc = self.subtitle_text.document()
         option = doc.defaultTextOption()
         option.setAlignment(Qt.AlignHCenter)
@@ -199,12 +200,6 @@ class VideoPlayerUI(QMainWindow):
         text_width = min(700, view_width - 40)  # Max width with margins
         self.subtitle_text.setTextWidth(text_width)
 
-        # Ensure text alignment is centered
-        doc = self.subtitle_text.document()
-        option = doc.defaultTextOption()
-        option.setAlignment(Qt.AlignHCenter)
-        doc.setDefaultTextOption(option)
-
         # Get text rectangle after width is set
         text_rect = self.subtitle_text.boundingRect()
 
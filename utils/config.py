@@ -2,8 +2,13 @@
 DEFAULT_SERVER_PORT = 8000
 API_BASE_URL = "http://localhost:{port}"
 UPLOAD_TIMEOUT = 600  # seconds
+UPLOAD_PROGRESS_INTERVAL = 0.1  # seconds between upload progress updates
+UPLOAD_CHUNK_SIZE = 1 << 20  # bytes read from the upload body per send
 CANCEL_TIMEOUT = 5  # seconds
-SERVER_HEALTH_CHECK_TIMEOUT = 2  # seconds
-SERVER_START_MAX_ATTEMPTS = 30
-BUFFERING_CHECK_INTERVAL = 100  # ms
-SUBTITLE_UPDATE_INTERVAL = 10
+WORKER_STOP_TIMEOUT = 5000  # ms to wait for the transcription worker thread to exit
+SERVER_HEALTH_CHECK_TIMEOUT = 0.5  # seconds
+SERVER_START_TIMEOUT = 30  # seconds
+SERVER_START_POLL_INITIAL_DELAY = 0.02  # seconds, grows by 1.7x per attempt
+SERVER_START_POLL_MAX_DELAY = 0.5  # seconds
+SUBTITLE_FALLBACK_INTERVAL = 1000  # ms, catches transcript changes the watcher missed
+SEEK_BUFFERING_DELAY = 150  # ms a seek may take before buffering is shown
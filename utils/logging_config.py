@@ -18,6 +18,9 @@ DETAILED_FILE_FORMAT = (
     "%(asctime)s [%(levelname)s] %(name)s: [%(filename)s:%(lineno)d] - %(message)s"
 )
 
+# App logger returned by setup_logging(); logging is configured only once
+_app_logger: Optional[logging.Logger] = None
+
 
 def cleanup_old_logs(prefix: str, keep_count: int = 3):
     """Clean up old log files, keeping only the most recent ones."""
@@ -33,7 +36,15 @@ def cleanup_old_logs(prefix: str, keep_count: int = 3):
 
 
 def setup_logging():
-    """Configure logging for the application."""
+    """Configure logging for the application.
+
+    Every component calls this from its constructor; only the first call
+    sets up handlers and log files, later calls return the same logger.
+    """
+    global _app_logger
+    if _app_logger is not None:
+        return _app_logger
+
     # Clean up old logs before setting up new logging
     cleanup_old_logs("app_")
     cleanup_old_logs("transcription_")
@@ -99,6 +110,7 @@ def setup_logging():
         logger = logging.getLogger(logger_name)
         logger.addHandler(transcription_file_handler)
 
+    _app_logger = app_logger
     return app_logger
 
 